@@ -0,0 +1,96 @@
+"""Measures reading a request body with `body_view`, `body` and `json`.
+
+With a `content-length`, `body_view` and `json` copy the body into a
+buffer preallocated up to `Request.preallocate_max_size` and grown after
+that, and read it in place. `body` joins the chunks into `bytes`, with or
+without a `content-length`. The peak of `json` includes the decoded
+document, a string as large as the body.
+
+Run from the root of the repository with:
+
+    $ PYTHONPATH=. python benchmarks/body.py
+"""
+
+import asyncio
+import timeit
+import tracemalloc
+
+from tarantino.http import HTTPRequest
+
+BODY_SIZES = [64 * 1024, 1024 * 1024, 16 * 1024 * 1024]
+CHUNK_SIZE = 64 * 1024
+NUMBER = 20
+
+
+# How the body is read, and whether the request has a `content-length`.
+MODES = [
+    ("view", "body_view", True),
+    ("body", "body", True),
+    ("json", "json", True),
+    ("join", "body", False),
+]
+
+
+def make_request(size: int, content_length: bool) -> HTTPRequest:
+    # A JSON string, so that every mode can read the same body.
+    payload = b'"' + b"x" * (size - 2) + b'"'
+    # Every chunk is a new object, like the ones received from the server.
+    messages = (
+        {
+            "type": "http.request",
+            "body": payload[idx : idx + CHUNK_SIZE],
+            "more_body": idx + CHUNK_SIZE < size,
+        }
+        for idx in range(0, size, CHUNK_SIZE)
+    )
+
+    async def receive():
+        return next(messages)
+
+    headers = [(b"content-length", str(size).encode())] if content_length else []
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": headers}
+    return HTTPRequest(scope, receive, None)
+
+
+def read_body(size: int, method: str, content_length: bool):
+    async def read():
+        # Not returned, `asyncio.run` would keep the result alive.
+        await getattr(make_request(size, content_length), method)()
+
+    asyncio.run(read())
+
+
+def peak_bytes(size: int, method: str, content_length: bool) -> int:
+    """Peak of the memory allocated while reading the body, measured inside
+    the event loop."""
+
+    async def measure():
+        request = make_request(size, content_length)
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        result = await getattr(request, method)()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+        return peak - baseline
+
+    return asyncio.run(measure())
+
+
+def main():
+    print(f"{'size':>10} {'mode':>10} {'time (ms)':>10} {'peak bytes':>11}")
+
+    for size in BODY_SIZES:
+        for name, method, content_length in MODES:
+            seconds = timeit.timeit(
+                lambda: read_body(size, method, content_length), number=NUMBER
+            )
+            print(
+                f"{size:>10} {name:>10} {seconds / NUMBER * 1e3:>10.2f} "
+                f"{peak_bytes(size, method, content_length):>11}"
+            )
+
+
+if __name__ == "__main__":
+    main()
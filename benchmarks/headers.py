@@ -0,0 +1,75 @@
+"""Measures the cost of `Headers` for a typical request and response.
+
+For every request the scope headers are wrapped, a couple of them are read,
+and the list is handed back to ASGI. For every response the content headers
+are set and the list is rendered.
+
+Run from the root of the repository with:
+
+    $ PYTHONPATH=. python benchmarks/headers.py
+"""
+
+import timeit
+import tracemalloc
+
+from tarantino.http.headers import Headers
+
+HEADER_COUNTS = [10, 20, 30]
+NUMBER = 2000
+
+
+def scope_headers(count: int):
+    headers = [
+        (b"host", b"localhost:8000"),
+        (b"user-agent", b"Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"),
+        (b"accept", b"*/*"),
+        (b"accept-encoding", b"gzip, deflate, br"),
+        (b"content-type", b"application/json"),
+    ]
+    for idx in range(count - len(headers)):
+        headers.append((f"x-custom-header-{idx}".encode(), b"some value"))
+    return headers
+
+
+def request_cycle(headers_list):
+    headers = Headers(headers_list=headers_list)
+    headers.get("host", decode=True)
+    headers.get("content-type", decode=True)
+    headers.get("cookie", "", decode=True)
+    return headers.to_list()
+
+
+def response_cycle(headers_list):
+    headers = Headers(headers_list=headers_list)
+    headers.set("content-type", "application/json")
+    headers.set("content-length", 1024)
+    return headers.to_list()
+
+
+def peak_bytes(fn, headers_list) -> int:
+    """Peak of the memory allocated while running one cycle."""
+    fn(headers_list)
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    fn(headers_list)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - baseline
+
+
+def main():
+    print(f"{'headers':>8} {'cycle':>9} {'time (us)':>10} {'peak bytes':>11}")
+
+    for count in HEADER_COUNTS:
+        headers_list = scope_headers(count)
+        for name, fn in [("request", request_cycle), ("response", response_cycle)]:
+            seconds = timeit.timeit(lambda: fn(headers_list), number=NUMBER)
+            print(
+                f"{count:>8} {name:>9} {seconds / NUMBER * 1e6:>10.2f} "
+                f"{peak_bytes(fn, headers_list):>11}"
+            )
+
+
+if __name__ == "__main__":
+    main()
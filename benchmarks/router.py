@@ -0,0 +1,54 @@
+"""Compares the route matchers of `Router` for a growing number of routes.
+
+Run from the root of the repository with:
+
+    $ PYTHONPATH=. python benchmarks/router.py
+"""
+
+import timeit
+
+from tarantino.endpoint import HTTPEndpoint
+from tarantino.router import ROUTE_MATCHERS, Router
+
+ROUTE_COUNTS = [10, 100, 1000]
+NUMBER = 2000
+
+
+def build_router(matcher: str, route_count: int) -> Router:
+    router = Router(matcher)
+    for idx in range(route_count):
+        path = f"/resource{idx}/{{item_id:int}}/detail/{{name}}"
+        router.add_endpoint(path, HTTPEndpoint(path))
+    router.freeze()
+    return router
+
+
+def bench(router: Router, uri: str) -> float:
+    seconds = timeit.timeit(lambda: router.match_uri(uri), number=NUMBER)
+    return seconds / NUMBER * 1e6
+
+
+def main():
+    print(
+        f"{'routes':>8} {'matcher':>8} {'first (us)':>12} {'last (us)':>12} {'miss (us)':>12}"
+    )
+
+    for route_count in ROUTE_COUNTS:
+        first_uri = "/resource0/1/detail/foo"
+        last_uri = f"/resource{route_count - 1}/1/detail/foo"
+        miss_uri = "/does/not/exist"
+
+        for matcher in ROUTE_MATCHERS:
+            router = build_router(matcher, route_count)
+            assert router.match_uri(last_uri)[0] is not None
+
+            print(
+                f"{route_count:>8} {matcher:>8} "
+                f"{bench(router, first_uri):>12.2f} "
+                f"{bench(router, last_uri):>12.2f} "
+                f"{bench(router, miss_uri):>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
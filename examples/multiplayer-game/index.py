@@ -4,7 +4,7 @@ from typing import Dict, Tuple
 
 from tarantino import Tarantino
 from tarantino.websocket import WebsocketConnection
-from tarantino.http import HTMLResponse, HTTPStatusCode, HTTPRequest
+from tarantino.http import FileResponse, HTTPRequest
 
 import game as ttt
 
@@ -16,10 +16,7 @@ _game_registry = dict()
 
 @app.get("/")
 async def index(request: HTTPRequest):
-    with open("./index.html") as fl:
-        body = fl.read()
-
-    return HTMLResponse(body, HTTPStatusCode.STATUS_200_OK)
+    return FileResponse("./index.html")
 
 
 class GAME_METHODS:
@@ -1,15 +1,60 @@
 from tarantino.casts import CastRegistry
 from tarantino.endpoint import HTTPEndpoint, WebsocketEndpoint
-from tarantino.http import HTTPMethods
+from tarantino.http import HTTP404Response, HTTPMethods
 from tarantino.imports import t
-from tarantino.router import Router
-from tarantino.types import CastType, Middleware
-
-
-class Tarantino:
-    def __init__(self, name, *, middlewares: t.Sequence[Middleware] = None):
+from tarantino.router import HostRouter, Router, get_host
+from tarantino.serialization import JSONCodec, JSONCodecs
+from tarantino.staticfiles import StaticFiles
+from tarantino.types import ASGIApp, CastType, Middleware
+from tarantino.websocket import WSStatusCode
+
+NOT_FOUND_MESSAGES = HTTP404Response().messages()
+
+
+class StaticFilesMixin:
+    """`mount_static` of `Tarantino` and `SubApp`, built on their
+    `register_http_endpoint`."""
+
+    def mount_static(
+        self,
+        prefix: str,
+        directory: str,
+        *,
+        name: str = None,
+        **kwargs,
+    ) -> StaticFiles:
+        """Serve the files under `directory` at `{prefix}/{path}`, `kwargs`
+        are passed on to `StaticFiles`."""
+        static_files = StaticFiles(directory, **kwargs)
+        path = prefix.rstrip("/") + "/{path:path}"
+        self.register_http_endpoint(path, methods=["get", "head"], name=name)(
+            static_files
+        )
+        return static_files
+
+
+class Tarantino(StaticFilesMixin):
+    def __init__(
+        self,
+        name,
+        *,
+        middlewares: t.Sequence[Middleware] = None,
+        route_matcher: t.Literal["trie", "regex", "linear"] = "trie",
+        route_cache_size: int = 0,
+        not_found_handler: ASGIApp = None,
+        max_body_size: int = None,
+    ):
+        """Request bodies larger than `max_body_size` bytes are answered with
+        a 413 when they are read, `limit_body_size` sets the limit of a
+        single route."""
         self.name = name
-        self.router = Router()
+        self.max_body_size = max_body_size
+        self.not_found_handler = not_found_handler or self.not_found
+        self.not_found_count = 0
+        self.router = Router(route_matcher, cache_size=route_cache_size)
+        self.host_router = HostRouter(
+            lambda: Router(route_matcher, cache_size=route_cache_size)
+        )
 
         self.asgi_app = self.build_middleware_stack(middlewares)
 
@@ -26,12 +71,18 @@ class Tarantino:
     def register_cast(self, cast_name: str, cast: CastType):
         CastRegistry.register_cast(cast_name, cast)
 
-    def register_http_endpoint(self, path: str, methods: t.List[str], *args, **kwargs):
+    def register_json_codec(self, codec_name: str, codec: JSONCodec):
+        JSONCodecs.register_codec(codec_name, codec)
+
+    def register_http_endpoint(
+        self,
+        path: str,
+        methods: t.List[str],
+        *args,
+        name: str = None,
+        **kwargs,
+    ):
         def _wrapper(fn):
-            for method in methods:
-                if method.upper() not in dir(HTTPMethods):
-                    raise ValueError(f"Invalid method: {method}")
-
             endpoint: HTTPEndpoint = self.router.setdefault_endpoint(
                 path,
                 HTTPEndpoint(path),
@@ -39,11 +90,19 @@ class Tarantino:
 
             handler = fn(*args, **kwargs) if isinstance(fn, type) else fn
             endpoint.add_handler(handler, methods)
+            if name is not None:
+                self.router.name_route(name, path)
             return fn
 
         return _wrapper
 
-    def register_websocket_endpoint(self, path: str, *args, **kwargs):
+    def register_websocket_endpoint(
+        self,
+        path: str,
+        *args,
+        name: str = None,
+        **kwargs,
+    ):
         def _wrapper(fn):
             endpoint: WebsocketEndpoint = self.router.setdefault_endpoint(
                 path,
@@ -52,75 +111,174 @@ class Tarantino:
 
             handler = fn(*args, **kwargs) if isinstance(fn, type) else fn
             endpoint.add_handler(handler)
+            if name is not None:
+                self.router.name_route(name, path)
 
         return _wrapper
 
+    def url_for(self, name: str, /, **params: t.Any) -> str:
+        for router in [self.router, *self.host_router.routers.values()]:
+            if name in router.named_routes:
+                return router.url_for(name, **params)
+        return self.router.url_for(name, **params)
+
+    def freeze(self):
+        """Freeze the routing table, this happens on startup or on the first
+        request if not done explicitly."""
+        self.router.freeze()
+        self.host_router.freeze()
+
+    def describe_routes(self) -> str:
+        tables = [self.router.describe()]
+        for host, router in self.host_router.routers.items():
+            tables.append(f"host: {host}\n{router.describe()}")
+        return "\n\n".join(tables)
+
+    async def not_found(self, scope, receive, send):
+        """Default `not_found_handler`, replays a prebuilt 404 response."""
+        if scope["type"] == "websocket":
+            await send(
+                {
+                    "type": "websocket.close",
+                    "code": WSStatusCode.STATUS_1000_NORMAL_CLOSURE,
+                }
+            )
+            return
+
+        start, body = NOT_FOUND_MESSAGES
+        await send(start)
+        await send(body)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+
+            if message["type"] == "lifespan.startup":
+                try:
+                    self.freeze()
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
     async def app(self, scope, receive, send):
         scope_type = scope["type"]
+        if scope_type == "lifespan":
+            await self.lifespan(receive, send)
+            return
+
         if scope_type not in ["http", "websocket"]:
             raise RuntimeError(f"Invalid scope type: {scope_type}")
 
+        if not self.router.frozen:
+            self.freeze()
+
+        router = self.router
+        host_params = None
+        if self.host_router:
+            host_router, host_params = self.host_router.match_host(get_host(scope))
+            if host_router is not None:
+                router = host_router
+
         path: str = scope["path"]
-        endpoint, kwargs = self.router.match_uri(path)
+        endpoint, kwargs = router.match_uri(path)
+        if host_params and endpoint is not None:
+            kwargs = {**host_params, **kwargs}
+
         if endpoint is None:
-            err = 'No callback found for the path: "%s"'
-            raise NotImplementedError(err % path)
-        await endpoint(scope, receive, send, **kwargs)
+            self.not_found_count += 1
+            await self.not_found_handler(scope, receive, send)
+            return
+
+        if kwargs:
+            await endpoint(scope, receive, send, **kwargs)
+        else:
+            await endpoint(scope, receive, send)
 
     async def __call__(self, scope, receive, send):
         scope["app"] = self
         return await self.asgi_app(scope, receive, send)
 
-    def get(self, path: str, *args, **kwargs):
-        return self.register_http_endpoint(path, methods=["get"], *args, **kwargs)
+    def get(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_http_endpoint(
+            path, name=name, methods=["get"], *args, **kwargs
+        )
 
-    def head(self, path: str, *args, **kwargs):
-        return self.register_http_endpoint(path, methods=["head"], *args, **kwargs)
+    def head(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_http_endpoint(
+            path, name=name, methods=["head"], *args, **kwargs
+        )
 
-    def post(self, path: str, *args, **kwargs):
-        return self.register_http_endpoint(path, methods=["post"], *args, **kwargs)
+    def post(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_http_endpoint(
+            path, name=name, methods=["post"], *args, **kwargs
+        )
 
-    def put(self, path: str, *args, **kwargs):
-        return self.register_http_endpoint(path, methods=["put"], *args, **kwargs)
+    def put(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_http_endpoint(
+            path, name=name, methods=["put"], *args, **kwargs
+        )
 
-    def delete(self, path: str, *args, **kwargs):
-        return self.register_http_endpoint(path, methods=["delete"], *args, **kwargs)
+    def delete(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_http_endpoint(
+            path, name=name, methods=["delete"], *args, **kwargs
+        )
 
-    def options(self, path: str, *args, **kwargs):
-        return self.register_http_endpoint(path, methods=["options"], *args, **kwargs)
+    def options(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_http_endpoint(
+            path, name=name, methods=["options"], *args, **kwargs
+        )
 
-    def trace(self, path: str, *args, **kwargs):
-        return self.register_http_endpoint(path, methods=["trace"], *args, **kwargs)
+    def trace(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_http_endpoint(
+            path, name=name, methods=["trace"], *args, **kwargs
+        )
 
-    def patch(self, path: str, *args, **kwargs):
-        return self.register_http_endpoint(path, methods=["patch"], *args, **kwargs)
+    def patch(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_http_endpoint(
+            path, name=name, methods=["patch"], *args, **kwargs
+        )
 
-    def websocket(self, path: str, *args, **kwargs):
-        return self.register_websocket_endpoint(path, *args, **kwargs)
+    def websocket(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_websocket_endpoint(path, name=name, *args, **kwargs)
 
-    def http(self, path: str, *args, **kwargs):
+    def http(self, path: str, *args, name: str = None, **kwargs):
         return self.register_http_endpoint(
-            path, methods=dir(HTTPMethods), *args, **kwargs
+            path, name=name, methods=HTTPMethods.methods, *args, **kwargs
         )
 
     def register_subapp(self, subapp: "SubApp"):
-        self.router.merge_router(subapp.prefix, subapp.router)
+        router = self.router
+        if subapp.host is not None:
+            router = self.host_router.router_for(subapp.host)
+        router.merge_router(subapp.prefix, subapp.router)
 
 
-class SubApp:
-    def __init__(self, prefix):
+class SubApp(StaticFilesMixin):
+    def __init__(self, prefix, *, host: str = None):
+        """Routes of a `SubApp` with a `host` such as `{tenant}.example.com`
+        are only matched for requests to that host, with the host params
+        passed to the handlers like path params."""
         self.prefix = prefix
+        self.host = host
         self.router = Router()
 
     def register_cast(self, cast_name: str, cast: CastType):
         CastRegistry.register_cast(cast_name, cast)
 
-    def register_http_endpoint(self, path: str, methods: t.List[str], *args, **kwargs):
+    def register_http_endpoint(
+        self,
+        path: str,
+        methods: t.List[str],
+        *args,
+        name: str = None,
+        **kwargs,
+    ):
         def _wrapper(fn):
-            for method in methods:
-                if method.upper() not in dir(HTTPMethods):
-                    raise ValueError(f"Invalid method: {method}")
-
             endpoint: HTTPEndpoint = self.router.setdefault_endpoint(
                 path,
                 HTTPEndpoint(path),
@@ -128,11 +286,19 @@ class SubApp:
 
             handler = fn(*args, **kwargs) if isinstance(fn, type) else fn
             endpoint.add_handler(handler, methods)
+            if name is not None:
+                self.router.name_route(name, path)
             return fn
 
         return _wrapper
 
-    def register_websocket_endpoint(self, path: str, *args, **kwargs):
+    def register_websocket_endpoint(
+        self,
+        path: str,
+        *args,
+        name: str = None,
+        **kwargs,
+    ):
         def _wrapper(fn):
             endpoint: WebsocketEndpoint = self.router.setdefault_endpoint(
                 path,
@@ -141,40 +307,60 @@ class SubApp:
 
             handler = fn(*args, **kwargs) if isinstance(fn, type) else fn
             endpoint.add_handler(handler)
+            if name is not None:
+                self.router.name_route(name, path)
 
         return _wrapper
 
-    def get(self, path: str, *args, **kwargs):
-        return self.register_http_endpoint(path, methods=["get"], *args, **kwargs)
+    def get(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_http_endpoint(
+            path, name=name, methods=["get"], *args, **kwargs
+        )
 
-    def head(self, path: str, *args, **kwargs):
-        return self.register_http_endpoint(path, methods=["head"], *args, **kwargs)
+    def head(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_http_endpoint(
+            path, name=name, methods=["head"], *args, **kwargs
+        )
 
-    def post(self, path: str, *args, **kwargs):
-        return self.register_http_endpoint(path, methods=["post"], *args, **kwargs)
+    def post(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_http_endpoint(
+            path, name=name, methods=["post"], *args, **kwargs
+        )
 
-    def put(self, path: str, *args, **kwargs):
-        return self.register_http_endpoint(path, methods=["put"], *args, **kwargs)
+    def put(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_http_endpoint(
+            path, name=name, methods=["put"], *args, **kwargs
+        )
 
-    def delete(self, path: str, *args, **kwargs):
-        return self.register_http_endpoint(path, methods=["delete"], *args, **kwargs)
+    def delete(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_http_endpoint(
+            path, name=name, methods=["delete"], *args, **kwargs
+        )
 
-    def options(self, path: str, *args, **kwargs):
-        return self.register_http_endpoint(path, methods=["options"], *args, **kwargs)
+    def options(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_http_endpoint(
+            path, name=name, methods=["options"], *args, **kwargs
+        )
 
-    def trace(self, path: str, *args, **kwargs):
-        return self.register_http_endpoint(path, methods=["trace"], *args, **kwargs)
+    def trace(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_http_endpoint(
+            path, name=name, methods=["trace"], *args, **kwargs
+        )
 
-    def patch(self, path: str, *args, **kwargs):
-        return self.register_http_endpoint(path, methods=["patch"], *args, **kwargs)
+    def patch(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_http_endpoint(
+            path, name=name, methods=["patch"], *args, **kwargs
+        )
 
-    def websocket(self, path: str, *args, **kwargs):
-        return self.register_websocket_endpoint(path, *args, **kwargs)
+    def websocket(self, path: str, *args, name: str = None, **kwargs):
+        return self.register_websocket_endpoint(path, name=name, *args, **kwargs)
 
-    def http(self, path: str, *args, **kwargs):
+    def http(self, path: str, *args, name: str = None, **kwargs):
         return self.register_http_endpoint(
-            path, methods=dir(HTTPMethods), *args, **kwargs
+            path, name=name, methods=HTTPMethods.methods, *args, **kwargs
         )
 
     def register_subapp(self, subapp: "SubApp"):
+        if subapp.host is not None:
+            raise ValueError("A SubApp with a host must be registered on the app.")
         self.router.merge_router(subapp.prefix, subapp.router)
@@ -0,0 +1,176 @@
+from tarantino.http import FileResponse, HTTPRequest, HTTPResponse, StreamingResponse
+from tarantino.http.utils import HTTPStatusCode
+from tarantino.imports import OrderedDict, asyncio, t, time, wraps
+from tarantino.types import HTTPHandler, Message
+
+CacheKey = t.Tuple[t.Any, ...]
+
+
+class CachedResponse:
+    """Replays the rendered ASGI messages of a response."""
+
+    __slots__ = ("start", "body", "size")
+
+    def __init__(self, start: Message, body: Message):
+        self.start = start
+        self.body = body
+        self.size = len(body["body"]) + sum(
+            len(key) + len(value) for key, value in start["headers"]
+        )
+
+    async def __call__(self, scope, receive, send):
+        await send(self.start)
+        await send(self.body)
+
+
+class CacheEntry(t.NamedTuple):
+    expires_at: float
+    size: int
+    response: CachedResponse | HTTPResponse
+
+
+class ResponseCache:
+    """LRU of responses bounded to `max_size` bytes of bodies and headers,
+    every entry expiring after its own TTL."""
+
+    def __init__(self, max_size: int = 16 * 1024 * 1024):
+        self.max_size = max_size
+        self.size = 0
+        self.entries: t.OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self.pending: t.Dict[CacheKey, asyncio.Future] = dict()
+
+    def get(self, key: CacheKey) -> CachedResponse | HTTPResponse | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self.pop(key)
+            return None
+
+        self.entries.move_to_end(key)
+        return entry.response
+
+    def set(
+        self,
+        key: CacheKey,
+        response: CachedResponse | HTTPResponse,
+        size: int,
+        ttl: float,
+    ):
+        self.pop(key)
+        if size > self.max_size:
+            return
+
+        self.entries[key] = CacheEntry(time.monotonic() + ttl, size, response)
+        self.size += size
+        while self.size > self.max_size:
+            _, entry = self.entries.popitem(last=False)
+            self.size -= entry.size
+
+    def pop(self, key: CacheKey):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+
+def cacheable(response: HTTPResponse) -> bool:
+    return (
+        isinstance(response, HTTPResponse)
+        and not isinstance(response, (StreamingResponse, FileResponse))
+        and response.status == HTTPStatusCode.STATUS_200_OK
+        and not response.cookies
+    )
+
+
+def to_cached(response: HTTPResponse) -> t.Tuple[CachedResponse | HTTPResponse, int]:
+    """What to store for a response and its size. A response answering
+    conditional or range requests is kept as is so that it still does."""
+    cached = CachedResponse(*response.messages())
+    if response.is_conditional:
+        return response, cached.size
+    return cached, cached.size
+
+
+def cache_response(
+    ttl: float,
+    *,
+    vary_headers: t.Sequence[str] = (),
+    vary_query: t.Sequence[str] = (),
+    cache: ResponseCache = None,
+) -> t.Callable[[HTTPHandler], HTTPHandler]:
+    """Cache the responses of a handler for `ttl` seconds.
+
+    Responses are keyed on the method, the path, the `vary_headers` and the
+    `vary_query` params of the request. Only complete 200 responses without
+    cookies are stored, as their rendered ASGI messages. Concurrent requests
+    for a key that is not cached yet wait for the first one instead of
+    running the handler again. Handlers share `cache` if it is given.
+    """
+    cache = cache if cache is not None else ResponseCache()
+    vary_headers = tuple(vary_headers)
+    vary_query = tuple(vary_query)
+
+    def _decorator(cb: HTTPHandler) -> HTTPHandler:
+        @wraps(cb)
+        async def _inner(request: HTTPRequest, **kwargs):
+            key = (
+                cb,
+                request.method,
+                request.path,
+                *(tuple(request.headers.get(name) or ()) for name in vary_headers),
+                *(tuple(request.query_params.get(name, ())) for name in vary_query),
+            )
+
+            while True:
+                response = cache.get(key)
+                if response is not None:
+                    return response
+
+                pending = cache.pending.get(key)
+                if pending is None:
+                    break
+
+                try:
+                    response = await asyncio.shield(pending)
+                except asyncio.CancelledError:
+                    if not pending.cancelled():
+                        raise
+                    # The request running the handler was cancelled.
+                    continue
+
+                # The response could not be shared, run the handler as well.
+                if response is None:
+                    return await cb(request, **kwargs)
+
+            future = asyncio.get_running_loop().create_future()
+            cache.pending[key] = future
+            shared = None
+            try:
+                response = await cb(request, **kwargs)
+                if cacheable(response):
+                    response, size = to_cached(response)
+                    cache.set(key, response, size, ttl)
+                    shared = response
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                future.set_exception(e)
+                # Marks the exception as retrieved when nobody waits for it.
+                future.exception()
+                raise
+            else:
+                future.set_result(shared)
+            finally:
+                cache.pending.pop(key, None)
+
+            return response
+
+        return _inner
+
+    return _decorator
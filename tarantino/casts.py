@@ -1,4 +1,4 @@
-from tarantino.imports import t
+from tarantino.imports import date, t, uuid
 from tarantino.types import CastType
 
 
@@ -40,6 +40,61 @@ class BoolCast(CastType):
 
 class StrCast(CastType):
     pattern = r"[^/]+"
+    specificity = 0
+
+    @staticmethod
+    def parse(value: str) -> str:
+        return value
+
+    @staticmethod
+    def to_str(value: str) -> str:
+        return value
+
+
+class UUIDCast(CastType):
+    pattern = r"[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}"
+
+    @staticmethod
+    def parse(value: str) -> uuid.UUID:
+        return uuid.UUID(value)
+
+    @staticmethod
+    def to_str(value: uuid.UUID) -> str:
+        return str(value)
+
+
+class PathCast(CastType):
+    """Matches the rest of the path, including `/`."""
+
+    pattern = r".+"
+    specificity = -1
+    multi_segment = True
+
+    @staticmethod
+    def parse(value: str) -> str:
+        return value
+
+    @staticmethod
+    def to_str(value: str) -> str:
+        return value
+
+
+class DateCast(CastType):
+    pattern = r"[0-9]{4}-[0-9]{2}-[0-9]{2}"
+
+    @staticmethod
+    def parse(value: str) -> date:
+        return date.fromisoformat(value)
+
+    @staticmethod
+    def to_str(value: date) -> str:
+        return value.isoformat()
+
+
+class SlugCast(CastType):
+    """Lowercase words joined by `-`, at most 128 characters long."""
+
+    pattern = r"[a-z0-9](?:[a-z0-9-]{0,126}[a-z0-9])?"
 
     @staticmethod
     def parse(value: str) -> str:
@@ -64,6 +119,10 @@ class _CastRegistry:
         self.register_cast("float", FloatCast)
         self.register_cast("bool", BoolCast)
         self.register_cast("str", StrCast)
+        self.register_cast("uuid", UUIDCast)
+        self.register_cast("path", PathCast)
+        self.register_cast("date", DateCast)
+        self.register_cast("slug", SlugCast)
 
     def register_cast(self, cast_name: str, cast: CastType):
         assert issubclass(cast, CastType)
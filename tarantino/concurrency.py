@@ -1,4 +1,6 @@
-from tarantino.imports import asyncio
+from tarantino.imports import asyncio, t
+
+T = t.TypeVar("T")
 
 
 def set_timeout(fn, sec, *args, **kwargs):
@@ -18,3 +20,21 @@ def set_interval(fn, sec, *args, **kwargs):
 
     task = asyncio.create_task(_wrapper())
     return task.cancel
+
+
+async def iterate_in_threadpool(iterator: t.Iterable[T]) -> t.AsyncIterator[T]:
+    """Iterate a blocking iterator in the default executor, one `next` call
+    at a time, so that it does not block the event loop."""
+    iterator = iter(iterator)
+    exhausted = object()
+
+    try:
+        while True:
+            item = await asyncio.to_thread(next, iterator, exhausted)
+            if item is exhausted:
+                break
+            yield item
+    finally:
+        # A generator still running in the executor cannot be closed.
+        if hasattr(iterator, "close") and not getattr(iterator, "gi_running", False):
+            iterator.close()
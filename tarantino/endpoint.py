@@ -1,10 +1,14 @@
 from tarantino.http import (
+    FormError,
+    FormTooLarge,
     Headers,
-    HTTPMethods,
     HTTPRequest,
     HTTPResponse,
     HTTPStatusCode,
+    RequestBodyTooLarge,
 )
+from tarantino.http.constants import ALLOW
+from tarantino.http.utils import HTTP_METHODS
 from tarantino.imports import t
 from tarantino.types import HTTPHandler, WebsocketHandler
 from tarantino.websocket import WebsocketConnection
@@ -15,49 +19,87 @@ class Endpoint:
         raise NotImplementedError()
 
 
+BODY_TOO_LARGE_MESSAGES = HTTPResponse(
+    "", HTTPStatusCode.STATUS_413_REQUEST_ENTITY_TOO_LARGE
+).messages()
+INVALID_FORM_MESSAGES = HTTPResponse(
+    "", HTTPStatusCode.STATUS_400_BAD_REQUEST
+).messages()
+
+
+def render_allow_messages(
+    status: int, allowed_methods: t.Iterable[str]
+) -> t.Tuple[t.Dict[str, t.Any], t.Dict[str, t.Any]]:
+    """Render the ASGI start and body messages of an empty response carrying
+    the `allow` header."""
+    headers = Headers()
+    headers.set(ALLOW, ", ".join(allowed_methods))
+    return HTTPResponse("", status, headers).messages()
+
+
 class HTTPEndpoint(Endpoint):
     def __init__(self, path):
         self.path = path
         self.method_handlers: t.Dict[str, HTTPHandler] = dict()
+        self.update_allowed_methods()
 
     async def __call__(self, scope, receive, send, **kwargs):
-        response: HTTPResponse = None
-        method = scope["method"]
-        if method not in self.method_handlers:
-            if method == "OPTIONS":
-                response = await self.default_options_handler()
+        handler = self.method_handlers.get(scope["method"])
+        if handler is None:
+            if scope["method"] == "OPTIONS":
+                start, body = self.options_messages
             else:
-                response = await self.method_not_allowed_handler()
-        else:
-            handler = self.method_handlers[method]
-            request = HTTPRequest(scope, receive, send)
+                start, body = self.method_not_allowed_messages
+            await send(start)
+            await send(body)
+            return
+
+        request = HTTPRequest(scope, receive, send)
+        try:
+            # A declared body over the limit is refused before the handler
+            # starts any work, even if it never reads the body.
+            request.max_body_size = getattr(
+                handler, "max_body_size", request.max_body_size
+            )
+            request.check_content_length()
             response: HTTPResponse = await handler(request, **kwargs)
-        await response(scope, receive, send)
+        except (RequestBodyTooLarge, FormTooLarge):
+            start, body = BODY_TOO_LARGE_MESSAGES
+            await send(start)
+            await send(body)
+            return
+        except FormError:
+            start, body = INVALID_FORM_MESSAGES
+            await send(start)
+            await send(body)
+            return
 
-    @property
-    def allowed_methods(self):
-        return set(["OPTIONS"] + list(self.method_handlers.keys()))
+        await response(scope, receive, send)
 
-    async def method_not_allowed_handler(self):
-        allowed_methods = self.allowed_methods
-        headers = Headers()
-        headers.set("allow", ", ".join(allowed_methods))
-        return HTTPResponse("", HTTPStatusCode.STATUS_405_METHOD_NOT_ALLOWED, headers)
+    def update_allowed_methods(self):
+        """Precompute the allow-list and the 405 and default OPTIONS
+        responses, these messages are shared and must not be mutated."""
+        self.allowed_methods = frozenset(["OPTIONS", *self.method_handlers])
 
-    async def default_options_handler(self):
-        allowed_methods = self.allowed_methods
-        headers = Headers()
-        headers.set("allow", ", ".join(allowed_methods))
-        return HTTPResponse("", HTTPStatusCode.STATUS_204_NO_CONTENT, headers)
+        allowed_methods = sorted(self.allowed_methods)
+        self.method_not_allowed_messages = render_allow_messages(
+            HTTPStatusCode.STATUS_405_METHOD_NOT_ALLOWED, allowed_methods
+        )
+        self.options_messages = render_allow_messages(
+            HTTPStatusCode.STATUS_204_NO_CONTENT, allowed_methods
+        )
 
     def add_handler(self, handler: HTTPHandler, methods: t.List[str]):
+        methods = [method.upper() for method in methods]
         for method in methods:
-            if method.upper() not in dir(HTTPMethods):
+            if method not in HTTP_METHODS:
                 raise ValueError(f"Invalid method: {method}")
-            if method.upper() in self.method_handlers:
+            if method in self.method_handlers:
                 raise ValueError(f"Handler already exists for method: {method}")
 
-            self.method_handlers[method.upper()] = handler
+        for method in methods:
+            self.method_handlers[method] = handler
+        self.update_allowed_methods()
 
     def extend(self, o: "HTTPEndpoint"):
         method_handlers = o.method_handlers
@@ -70,6 +112,7 @@ class HTTPEndpoint(Endpoint):
             raise ValueError(f"Found overlapping methods: {overlapping_methods}")
 
         self.method_handlers.update(method_handlers)
+        self.update_allowed_methods()
 
 
 class WebsocketEndpoint(Endpoint):
@@ -1,11 +1,15 @@
 from tarantino.http.cookie import Cookie
+from tarantino.http.forms import FormData, FormError, FormTooLarge, UploadFile
 from tarantino.http.headers import Headers
 from tarantino.http.request import Request as HTTPRequest
+from tarantino.http.request import RequestBodyTooLarge
 from tarantino.http.response import (
+    FileResponse,
     HTMLResponse,
     HTTP200Response,
     HTTP404Response,
     JSONResponse,
 )
 from tarantino.http.response import Response as HTTPResponse
+from tarantino.http.response import StreamingResponse
 from tarantino.http.utils import HTTPMethods, HTTPStatusCode
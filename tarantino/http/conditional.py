@@ -0,0 +1,122 @@
+"""Helpers for conditional (`If-None-Match`, `If-Modified-Since`) and range
+(`Range`, `If-Range`) requests."""
+
+from tarantino.imports import parsedate_to_datetime, t, uuid
+
+# Requests with more ranges than this are answered with the full body.
+MAX_RANGES = 16
+
+
+def parse_etags(value: str) -> t.List[str]:
+    return [etag.strip() for etag in value.split(",") if etag.strip()]
+
+
+def weak_etag_match(etag: str, other: str) -> bool:
+    return etag.removeprefix("W/") == other.removeprefix("W/")
+
+
+def strong_etag_match(etag: str, other: str) -> bool:
+    return not etag.startswith("W/") and etag == other
+
+
+def parse_http_date(value: str) -> float | None:
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def is_not_modified(
+    if_none_match: str | None,
+    if_modified_since: str | None,
+    etag: str | None,
+    last_modified: float | None,
+) -> bool:
+    """`If-None-Match` takes precedence over `If-Modified-Since`."""
+    if if_none_match is not None:
+        if etag is None:
+            return False
+        return any(
+            candidate == "*" or weak_etag_match(candidate, etag)
+            for candidate in parse_etags(if_none_match)
+        )
+
+    if if_modified_since is not None and last_modified is not None:
+        since = parse_http_date(if_modified_since)
+        return since is not None and int(last_modified) <= since
+
+    return False
+
+
+def if_range_matches(
+    if_range: str | None, etag: str | None, last_modified: float | None
+) -> bool:
+    if if_range is None:
+        return True
+
+    if if_range.startswith('"') or if_range.startswith("W/"):
+        return etag is not None and strong_etag_match(if_range, etag)
+
+    since = parse_http_date(if_range)
+    return (
+        since is not None and last_modified is not None and int(last_modified) == since
+    )
+
+
+def parse_range(value: str, size: int) -> t.List[t.Tuple[int, int]] | None:
+    """Parse a `Range` header into `(start, stop)` pairs with exclusive stops.
+
+    Returns `None` when the header is invalid or should be ignored, and an
+    empty list when none of the ranges can be satisfied.
+    """
+    unit, _, ranges_spec = value.partition("=")
+    if unit.strip().lower() != "bytes" or not ranges_spec:
+        return None
+
+    specs = ranges_spec.split(",")
+    if len(specs) > MAX_RANGES:
+        return None
+
+    ranges = list()
+    for spec in specs:
+        first, dash, last = spec.strip().partition("-")
+        if not dash:
+            return None
+
+        try:
+            if not first:
+                suffix = int(last)
+                if suffix <= 0:
+                    continue
+                start, stop = max(size - suffix, 0), size
+            else:
+                start = int(first)
+                stop = int(last) + 1 if last else size
+        except ValueError:
+            return None
+
+        if start >= size:
+            continue
+        if stop <= start:
+            return None
+        ranges.append((start, min(stop, size)))
+
+    return ranges
+
+
+def multipart_boundary() -> str:
+    return uuid.uuid4().hex
+
+
+def multipart_part_header(
+    boundary: str, content_type: str, start: int, stop: int, size: int
+) -> bytes:
+    return (
+        f"--{boundary}\r\n"
+        f"content-type: {content_type}\r\n"
+        f"content-range: bytes {start}-{stop - 1}/{size}\r\n\r\n"
+    ).encode("latin-1")
+
+
+def multipart_end(boundary: str) -> bytes:
+    return f"--{boundary}--\r\n".encode("latin-1")
@@ -0,0 +1,28 @@
+"""Pre-encoded header names and values used when rendering responses."""
+
+CONTENT_TYPE = b"content-type"
+CONTENT_LENGTH = b"content-length"
+CONTENT_DISPOSITION = b"content-disposition"
+LAST_MODIFIED = b"last-modified"
+ETAG = b"etag"
+ACCEPT_RANGES = b"accept-ranges"
+CONTENT_RANGE = b"content-range"
+CONTENT_ENCODING = b"content-encoding"
+VARY = b"vary"
+LOCATION = b"location"
+ALLOW = b"allow"
+SET_COOKIE = b"set-cookie"
+
+TEXT_PLAIN = b"text/plain; charset=utf8"
+TEXT_HTML = b"text/html; charset=utf8"
+APPLICATION_JSON = b"application/json"
+BYTES = b"bytes"
+
+_CACHED_CONTENT_LENGTHS = tuple(str(length).encode() for length in range(4096))
+
+
+def encode_content_length(length: int) -> bytes:
+    """Encoded `content-length` value, bodies under 4 KiB are looked up."""
+    if length < 4096:
+        return _CACHED_CONTENT_LENGTHS[length]
+    return str(length).encode()
@@ -1,3 +1,4 @@
+from tarantino.http.constants import SET_COOKIE
 from tarantino.imports import datetime, t
 
 
@@ -64,7 +65,7 @@ class Cookie:
         return cookie_str
 
     def to_header(self):
-        return (b"set-cookie", str(self).encode("utf-8"))
+        return (SET_COOKIE, str(self).encode("utf-8"))
 
 
 def parse_cookies(cookie_str: str) -> t.Dict[str, str]:
@@ -0,0 +1,314 @@
+"""Incremental parsers for `multipart/form-data` and
+`application/x-www-form-urlencoded` request bodies."""
+
+from tarantino.imports import asyncio, parse, re, t, tempfile
+
+OPTION_PATTERN = re.compile(r';\s*([^\s=;]+)\s*=\s*("(?:[^"\\]|\\.)*"|[^;]*)')
+
+
+class FormError(ValueError):
+    """The form is malformed or larger than the limits allow."""
+
+
+class FormTooLarge(FormError):
+    """The form, one of its parts or their headers is over the size
+    limits."""
+
+
+def parse_options_header(value: str) -> t.Tuple[str, t.Dict[str, str]]:
+    """Split a header like `form-data; name="file"` into its value and its
+    lowercased options."""
+    main, _, rest = value.partition(";")
+    options = dict()
+    for match in OPTION_PATTERN.finditer(";" + rest):
+        key, option = match.group(1).lower(), match.group(2).strip()
+        if len(option) >= 2 and option[0] == option[-1] == '"':
+            option = re.sub(r"\\(.)", r"\1", option[1:-1])
+        options[key] = option
+    return main.strip().lower(), options
+
+
+class UploadFile:
+    """A file part of a form, spooled to a temporary file on disk once it
+    is larger than `spool_max_size`."""
+
+    def __init__(
+        self,
+        filename: str,
+        content_type: str | None = None,
+        headers: t.Dict[str, str] | None = None,
+        spool_max_size: int = 1024 * 1024,
+    ):
+        self.filename = filename
+        self.content_type = content_type
+        self.headers = headers or dict()
+        self.spool_max_size = spool_max_size
+        self.file = tempfile.SpooledTemporaryFile(max_size=spool_max_size)
+        self.size = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        return await asyncio.to_thread(self.file.read, size)
+
+    async def write(self, data: bytes):
+        # Writes stay in the event loop while the file is in memory. The one
+        # crossing `spool_max_size` rolls it over to disk, in a thread like
+        # every write after it.
+        self.size += len(data)
+        if self.size <= self.spool_max_size:
+            self.file.write(data)
+        else:
+            await asyncio.to_thread(self.file.write, data)
+
+    async def seek(self, offset: int):
+        await asyncio.to_thread(self.file.seek, offset)
+
+    async def close(self):
+        await asyncio.to_thread(self.file.close)
+
+    def __repr__(self):
+        return f"UploadFile(filename={self.filename!r}, size={self.size})"
+
+
+class FormData(t.Mapping[str, t.Any]):
+    """Multidict of form fields, indexing returns the first value of a key
+    and `getlist` all of them."""
+
+    def __init__(self, items: t.Iterable[t.Tuple[str, t.Any]] = ()):
+        self._items: t.List[t.Tuple[str, t.Any]] = list(items)
+
+    def append(self, key: str, value: t.Any):
+        self._items.append((key, value))
+
+    def getlist(self, key: str) -> t.List[t.Any]:
+        return [value for k, value in self._items if k == key]
+
+    def multi_items(self) -> t.List[t.Tuple[str, t.Any]]:
+        return list(self._items)
+
+    def __getitem__(self, key: str):
+        for k, value in self._items:
+            if k == key:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(dict.fromkeys(k for k, _ in self._items))
+
+    def __len__(self):
+        return len(dict.fromkeys(k for k, _ in self._items))
+
+    async def close(self):
+        for _, value in self._items:
+            if isinstance(value, UploadFile):
+                await value.close()
+
+    def __repr__(self):
+        return f"FormData({self._items!r})"
+
+
+class FormField:
+    __slots__ = ("name", "charset", "data")
+
+    def __init__(self, name: str, charset: str):
+        self.name = name
+        self.charset = charset
+        self.data = bytearray()
+
+
+class FormLimits(t.NamedTuple):
+    # Size of the whole body, `None` for no limit.
+    max_size: int | None = None
+    # Size of a field, fields are kept in memory.
+    max_field_size: int = 1024 * 1024
+    # Size of all the fields together, so that their memory stays bounded
+    # whatever the number of parts.
+    max_fields_size: int = 8 * 1024 * 1024
+    # Size of a file, `None` for no limit.
+    max_file_size: int | None = None
+    max_parts: int = 1000
+    # Files larger than this are spooled to disk.
+    spool_max_size: int = 1024 * 1024
+
+
+class MultipartParser:
+    """Parses a `multipart/form-data` body chunk by chunk.
+
+    At most one chunk plus the length of the boundary is buffered, field
+    values are held in memory up to `max_field_size` each and
+    `max_fields_size` together, and files are spooled to disk, so memory
+    stays bounded whatever the size of the upload.
+    """
+
+    max_headers_size = 16 * 1024
+
+    PREAMBLE, AFTER_DELIMITER, HEADERS, BODY, END = range(5)
+
+    def __init__(
+        self, boundary: bytes, limits: FormLimits = FormLimits(), encoding="utf-8"
+    ):
+        self.delimiter = b"--" + boundary
+        self.body_delimiter = b"\r\n" + self.delimiter
+        self.limits = limits
+        self.encoding = encoding
+
+        self.form = FormData()
+        self.state = self.PREAMBLE
+        self.buffer = bytearray()
+        self.size = 0
+        self.fields_size = 0
+        self.parts = 0
+        self.part: FormField | UploadFile | None = None
+        self.part_name: str | None = None
+
+    async def parse(self, stream: t.AsyncIterator[bytes]) -> FormData:
+        try:
+            async for chunk in stream:
+                await self.feed(chunk)
+            if self.state != self.END:
+                raise FormError("Incomplete multipart body.")
+        except BaseException:
+            if isinstance(self.part, UploadFile):
+                await self.part.close()
+            await self.form.close()
+            raise
+
+        return self.form
+
+    async def feed(self, chunk: bytes):
+        self.size += len(chunk)
+        if self.limits.max_size is not None and self.size > self.limits.max_size:
+            raise FormTooLarge("Form body is too large.")
+
+        buffer = self.buffer
+        buffer += chunk
+
+        while True:
+            if self.state == self.PREAMBLE:
+                idx = buffer.find(self.delimiter)
+                if idx == -1:
+                    # Keep what could be the start of the delimiter.
+                    del buffer[: max(len(buffer) - len(self.delimiter) + 1, 0)]
+                    return
+                del buffer[: idx + len(self.delimiter)]
+                self.state = self.AFTER_DELIMITER
+
+            elif self.state == self.AFTER_DELIMITER:
+                if len(buffer) < 2:
+                    return
+                if buffer[:2] == b"--":
+                    buffer.clear()
+                    self.state = self.END
+                    return
+                if buffer[:2] != b"\r\n":
+                    raise FormError("Malformed multipart body.")
+                del buffer[:2]
+                self.state = self.HEADERS
+
+            elif self.state == self.HEADERS:
+                idx = buffer.find(b"\r\n\r\n")
+                if idx == -1:
+                    if len(buffer) > self.max_headers_size:
+                        raise FormTooLarge("Multipart headers are too large.")
+                    return
+                self.start_part(bytes(buffer[:idx]))
+                del buffer[: idx + 4]
+                self.state = self.BODY
+
+            elif self.state == self.BODY:
+                idx = buffer.find(self.body_delimiter)
+                if idx == -1:
+                    # Keep what could be the start of the delimiter.
+                    end = len(buffer) - len(self.body_delimiter) + 1
+                    if end > 0:
+                        await self.write(buffer[:end])
+                        del buffer[:end]
+                    return
+                await self.write(buffer[:idx])
+                del buffer[: idx + len(self.body_delimiter)]
+                await self.finish_part()
+                self.state = self.AFTER_DELIMITER
+
+            else:
+                # The epilogue is ignored.
+                buffer.clear()
+                return
+
+    def start_part(self, raw_headers: bytes):
+        self.parts += 1
+        if self.parts > self.limits.max_parts:
+            raise FormError("Too many form parts.")
+
+        headers = dict()
+        for line in raw_headers.decode("latin-1").split("\r\n"):
+            key, sep, value = line.partition(":")
+            if not sep:
+                raise FormError("Malformed multipart headers.")
+            headers[key.strip().lower()] = value.strip()
+
+        disposition, options = parse_options_header(
+            headers.get("content-disposition", "")
+        )
+        if disposition != "form-data" or "name" not in options:
+            raise FormError("Missing form-data content disposition.")
+
+        self.part_name = name = options["name"]
+        content_type = headers.get("content-type")
+        if "filename" in options:
+            self.part = UploadFile(
+                options["filename"],
+                content_type,
+                headers,
+                spool_max_size=self.limits.spool_max_size,
+            )
+        else:
+            _, type_options = parse_options_header(content_type or "")
+            self.part = FormField(name, type_options.get("charset", self.encoding))
+
+    async def write(self, data: bytearray):
+        part = self.part
+        if isinstance(part, UploadFile):
+            max_file_size = self.limits.max_file_size
+            if max_file_size is not None and part.size + len(data) > max_file_size:
+                raise FormTooLarge(f"File {part.filename!r} is too large.")
+            await part.write(data)
+        else:
+            part.data += data
+            self.fields_size += len(data)
+            if len(part.data) > self.limits.max_field_size:
+                raise FormTooLarge(f"Field {part.name!r} is too large.")
+            if self.fields_size > self.limits.max_fields_size:
+                raise FormTooLarge("Form fields are too large.")
+
+    async def finish_part(self):
+        part, self.part = self.part, None
+        if isinstance(part, UploadFile):
+            await part.seek(0)
+            self.form.append(self.part_name, part)
+        else:
+            try:
+                value = part.data.decode(part.charset)
+            except (LookupError, UnicodeDecodeError):
+                raise FormError(f"Field {part.name!r} could not be decoded.")
+            self.form.append(part.name, value)
+
+
+async def parse_urlencoded(
+    stream: t.AsyncIterator[bytes], limits: FormLimits = FormLimits()
+) -> FormData:
+    """The body is buffered, up to `max_size` or else `max_field_size`."""
+    max_size = limits.max_size
+    if max_size is None:
+        max_size = limits.max_field_size
+
+    body = bytearray()
+    async for chunk in stream:
+        body += chunk
+        if len(body) > max_size:
+            raise FormTooLarge("Form body is too large.")
+
+    fields = parse.parse_qsl(
+        body.decode("utf-8", errors="replace"), keep_blank_values=True
+    )
+    if len(fields) > limits.max_parts:
+        raise FormError("Too many form parts.")
+    return FormData(fields)
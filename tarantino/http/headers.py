@@ -1,7 +1,16 @@
 from tarantino.imports import t
 
+RawHeaders = t.List[t.Tuple[bytes, bytes]]
+
 
 class Headers(t.Mapping[str, str]):
+    """Multidict over a raw ASGI `[(name, value), ...]` list.
+
+    A list passed as `headers_list` is borrowed: it is only copied on the
+    first modification and `to_list` hands it back as is until then. The
+    lowercase index used for lookups is built on the first read.
+    """
+
     encoding_type = "latin-1"
 
     def __init__(
@@ -13,21 +22,21 @@ class Headers(t.Mapping[str, str]):
         if headers_dict is not None and headers_list is not None:
             raise AssertionError("Only one of headers and scope should be set.")
 
-        self._headers: t.Dict[bytes, t.List[bytes] | bytes] = dict()
+        self._index: t.Dict[bytes, bytes | t.List[bytes]] | None = None
 
-        if headers_dict is None and headers_list is None:
+        if headers_list is not None:
+            self._list: RawHeaders = headers_list
+            self._owned = False
             return
 
+        self._list = list()
+        self._owned = True
+
         if headers_dict:
             for k, v in headers_dict.items():
-
                 key = self.encode_key(k)
-                value = self.encode_value(v)
-                self._headers[key] = value
-
-        if headers_list:
-            for k, v in headers_list:
-                self.set(k, v, mode="append")
+                for value in self.encode_value(v):
+                    self._list.append((key, value))
 
     def encode(self, s: t.Any):
         return s if isinstance(s, bytes) else bytes(str(s), encoding=self.encoding_type)
@@ -37,7 +46,8 @@ class Headers(t.Mapping[str, str]):
 
     def encode_key(self, key: str | bytes):
         assert isinstance(key, (str, bytes))
-        return self.encode(key)
+        key = self.encode(key)
+        return key if key.islower() else key.lower()
 
     def encode_value(self, value: t.Any | list):
         value = value if isinstance(value, list) else [value]
@@ -54,16 +64,63 @@ class Headers(t.Mapping[str, str]):
         else:
             return value
 
+    @property
+    def _headers(self) -> t.Dict[bytes, bytes | t.List[bytes]]:
+        """Lowercase index of the headers, a key maps to its value or to the
+        list of its values if it is repeated."""
+        if self._index is None:
+            index = dict()
+            for k, v in self._list:
+                key = self.encode_key(k)
+                if key in index:
+                    values = index[key]
+                    if isinstance(values, list):
+                        values.append(self.encode(v))
+                    else:
+                        index[key] = [values, self.encode(v)]
+                else:
+                    index[key] = self.encode(v)
+            self._index = index
+        return self._index
+
+    def _values(self, key: bytes) -> t.List[bytes] | None:
+        values = self._headers.get(key)
+        if values is None:
+            return None
+        return list(values) if isinstance(values, list) else [values]
+
+    def _own(self):
+        if not self._owned:
+            self._list = list(self._list)
+            self._owned = True
+
+    def _remove(self, key: bytes):
+        self._own()
+        headers_list = self._list
+        for idx in range(len(headers_list) - 1, -1, -1):
+            if self.encode_key(headers_list[idx][0]) == key:
+                del headers_list[idx]
+
+        if self._index is not None:
+            self._index.pop(key, None)
+
     def __setitem__(self, key: str | bytes, value: str | bytes):
-        key = self.encode_key(key)
-        value = self.encode_value(value)
-        self._headers[key] = value
+        self.set(key, value, mode="replace")
 
     def __getitem__(self, key: str | bytes):
-        return self._headers[self.encode(key)]
+        values = self._values(self.encode_key(key))
+        if values is None:
+            raise KeyError(key)
+        return values
 
     def __delitem__(self, key: str | bytes):
-        del self._headers[self.encode_key(key)]
+        key = self.encode_key(key)
+        if key not in self._headers:
+            raise KeyError(key)
+        self._remove(key)
+
+    def __contains__(self, key: str | bytes):
+        return self.encode_key(key) in self._headers
 
     def __iter__(self):
         return iter(self._headers.keys())
@@ -75,7 +132,7 @@ class Headers(t.Mapping[str, str]):
         return [self.decode_key(key) for key in self._headers.keys()]
 
     def values(self):
-        return [self.decode_value(value) for value in self._headers.values()]
+        return [self.decode_value(self._values(key)) for key in self._headers.keys()]
 
     def get(
         self,
@@ -83,8 +140,12 @@ class Headers(t.Mapping[str, str]):
         default: t.Any = None,
         decode=False,
     ):
-        value = self._headers.get(self.encode(key), self.encode_value(default))
-        return self.decode_value(value) if decode else value
+        values = self._values(self.encode_key(key))
+        if values is None:
+            if default is None:
+                return None
+            values = self.encode_value(default)
+        return self.decode_value(values) if decode else values
 
     def set(
         self,
@@ -96,13 +157,26 @@ class Headers(t.Mapping[str, str]):
             raise ValueError(f"Invalid set mode: {mode}")
 
         key = self.encode_key(key)
+        values = self.encode_value(value)
 
-        if mode == "append":
-            value = self._headers.get(key, []) + self.encode_value(value)
-            self[key] = value
+        if mode == "replace":
+            self._remove(key)
 
-        elif mode == "replace":
-            self[key] = self.encode_value(value)
+        self._own()
+        for value in values:
+            self._list.append((key, value))
+
+        index = self._index
+        if index is None or not values:
+            return
+
+        current = index.get(key)
+        if current is None:
+            index[key] = values[0] if len(values) == 1 else values
+        elif isinstance(current, list):
+            current.extend(values)
+        else:
+            index[key] = [current, *values]
 
     def pop(
         self,
@@ -137,14 +211,9 @@ class Headers(t.Mapping[str, str]):
         return value
 
     def to_list(self, decode=False):
-        headers_list = list()
-
-        for k, v in self._headers.items():
-            key = self.decode_key(k) if decode else k
-            values = self.decode_value(v) if decode else v
-            values = values if isinstance(values, list) else [values]
-
-            for value in values:
-                headers_list.append((key, value))
+        if decode:
+            return [(self.decode(k), self.decode(v)) for k, v in self._list]
 
-        return headers_list
+        # The caller may keep the list, so it is copied on the next change.
+        self._owned = False
+        return self._list
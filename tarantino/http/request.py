@@ -1,32 +1,137 @@
 from tarantino.http.cookie import parse_cookies
+from tarantino.http.forms import (
+    FormData,
+    FormLimits,
+    MultipartParser,
+    parse_options_header,
+    parse_urlencoded,
+)
 from tarantino.http.headers import Headers
-from tarantino.imports import json, parse
+from tarantino.imports import parse, t
+from tarantino.serialization import JSONCodecs
+
+
+class RequestBodyTooLarge(Exception):
+    """The request body is larger than `Request.max_body_size`."""
+
+    def __init__(self, max_body_size: int):
+        super().__init__(f"Request body exceeds {max_body_size} bytes.")
+        self.max_body_size = max_body_size
 
 
 class Request:
+    """Only `scope`, `receive` and `send` are stored on construction, the
+    rest is parsed from the scope the first time it is accessed."""
+
+    __slots__ = (
+        "scope",
+        "asgi_receive",
+        "asgi_send",
+        "credentials",
+        "max_body_size",
+        "_query_params",
+        "_headers",
+        "_cookies",
+        "_content_length",
+        "_content_type",
+        "_stream_consumed",
+        "_body",
+        "_json",
+        "_form",
+    )
+
     headers_encoding = "latin-1"
     body_encoding = "utf-8"
+    # At most this much of a declared `content-length` is preallocated, so
+    # that a client cannot reserve memory without sending the body. The
+    # buffer grows past it as the rest of the body arrives.
+    preallocate_max_size = 1024 * 1024
 
     def __init__(self, scope: dict, receive, send):
         self.scope = scope
         self.asgi_receive = receive
         self.asgi_send = send
 
-        self.query_params = parse.parse_qs(self.scope.get("query_string", b"").decode())
-        self.headers = Headers(headers_list=scope["headers"])
-        self.cookies = parse_cookies(self.headers.get("cookie", "", decode=True))
-        self.client = self.scope["client"]
-        self.http_version = self.scope["http_version"]
-        self.method = self.scope.get("method")
-        self.path = self.scope.get("path")
-        self.content_length = self.headers.get("content-length", decode=True)
-        self.content_type = self.headers.get("content-type", decode=True)
-
         self._stream_consumed = False
+        # Set by the app, and per route by `limit_body_size`.
+        self.max_body_size: int | None = getattr(
+            scope.get("app"), "max_body_size", None
+        )
+
+    @property
+    def query_params(self) -> t.Dict[str, t.List[str]]:
+        try:
+            return self._query_params
+        except AttributeError:
+            query_string = self.scope.get("query_string", b"").decode()
+            self._query_params = parse.parse_qs(query_string)
+            return self._query_params
+
+    @property
+    def headers(self) -> Headers:
+        try:
+            return self._headers
+        except AttributeError:
+            self._headers = Headers(headers_list=self.scope["headers"])
+            return self._headers
+
+    @property
+    def cookies(self) -> t.Dict[str, str]:
+        try:
+            return self._cookies
+        except AttributeError:
+            cookie = self.headers.get("cookie", "", decode=True)
+            self._cookies = parse_cookies(cookie)
+            return self._cookies
+
+    @property
+    def content_length(self) -> str | None:
+        try:
+            return self._content_length
+        except AttributeError:
+            self._content_length = self.headers.get("content-length", decode=True)
+            return self._content_length
+
+    @property
+    def content_type(self) -> str | None:
+        try:
+            return self._content_type
+        except AttributeError:
+            self._content_type = self.headers.get("content-type", decode=True)
+            return self._content_type
+
+    @property
+    def client(self) -> t.Tuple[str, int] | None:
+        return self.scope.get("client")
+
+    @property
+    def http_version(self) -> str:
+        return self.scope.get("http_version", "1.1")
+
+    @property
+    def method(self) -> str | None:
+        return self.scope.get("method")
+
+    @property
+    def path(self) -> str | None:
+        return self.scope.get("path")
+
+    def check_content_length(self):
+        """Raise `RequestBodyTooLarge` if the declared `content-length` is
+        over the limit, before any of the body is read."""
+        if self.max_body_size is None or self.content_length is None:
+            return
+
+        try:
+            content_length = int(self.content_length)
+        except (TypeError, ValueError):
+            return
+        if content_length > self.max_body_size:
+            raise RequestBodyTooLarge(self.max_body_size)
 
     async def stream(self):
         if hasattr(self, "_body"):
-            yield self._body
+            yield await self.body()
             yield b""
             return
 
@@ -34,26 +139,81 @@ class Request:
             raise RuntimeError("Stream already consumed.")
 
         self._stream_consumed = True
+        self.check_content_length()
+        max_body_size = self.max_body_size
+        received = 0
         while True:
             message = await self.asgi_receive()
             body = message.get("body", b"")
             if body:
+                # Counted as well, chunked bodies have no `content-length`.
+                if max_body_size is not None:
+                    received += len(body)
+                    if received > max_body_size:
+                        raise RequestBodyTooLarge(max_body_size)
                 yield body
             if not message.get("more_body", False):
                 break
         yield b""
 
-    async def body(self, as_str=False):
+    async def _read_body(self) -> bytes | bytearray:
+        """Read the body into a `bytearray` sized from the declared
+        `content-length`, copying every chunk into place. Without a usable
+        `content-length` the chunks are joined instead.
+
+        Used by `body_view` and `json`, which read the buffer in place.
+        `body` joins the chunks, a `bytes` copy of the buffer would be a
+        second copy of the body.
+        """
+        self.check_content_length()
+        try:
+            length = int(self.content_length)
+        except (TypeError, ValueError):
+            length = None
+
+        if length is None or length < 0:
+            return b"".join([chunk async for chunk in self.stream()])
+
+        size = min(length, self.preallocate_max_size)
+        if self.max_body_size is not None:
+            size = min(size, self.max_body_size)
+
+        buffer = bytearray(size)
+        received = 0
+        async for chunk in self.stream():
+            end = received + len(chunk)
+            if end > length:
+                raise RuntimeError("Request body exceeds its content-length.")
+            if end <= len(buffer):
+                buffer[received:end] = chunk
+            else:
+                del buffer[received:]
+                buffer += chunk
+            received = end
+
+        # The client went away before sending the whole body.
+        if received < len(buffer):
+            del buffer[received:]
+        return buffer
+
+    async def body(self, as_str=False) -> bytes | str:
         if not hasattr(self, "_body"):
-            chunks = []
-            async for chunk in self.stream():
-                chunks.append(chunk)
-            self._body = b"".join(chunks)
+            self._body = b"".join([chunk async for chunk in self.stream()])
+        elif type(self._body) is not bytes:
+            # Already read into a buffer by `body_view` or `json`.
+            self._body = bytes(self._body)
 
         if as_str:
             return self._body.decode(self.body_encoding)
         return self._body
 
+    async def body_view(self) -> memoryview:
+        """A read-only `memoryview` of the body, read into a preallocated
+        buffer without any copy past the one out of the received chunks."""
+        if not hasattr(self, "_body"):
+            self._body = await self._read_body()
+        return memoryview(self._body).toreadonly()
+
     async def text(self):
         return await self.body(as_str=True)
 
@@ -61,6 +221,32 @@ class Request:
         return await self.body(as_str=False)
 
     async def json(self):
-        if not hasattr(self, "_json"):
-            self._json = json.loads(await self.body())
-        return self._json
+        try:
+            return self._json
+        except AttributeError:
+            if not hasattr(self, "_body"):
+                self._body = await self._read_body()
+            # The codecs decode the preallocated `bytearray` as is.
+            self._json = JSONCodecs.loads(self._body)
+            return self._json
+
+    async def form(self, **limits: t.Any) -> FormData:
+        """Parse a `multipart/form-data` or `application/x-www-form-urlencoded`
+        body while it is streamed, `limits` are the fields of `FormLimits`.
+        Raises `FormError` for malformed forms or forms over the limits."""
+        try:
+            return self._form
+        except AttributeError:
+            pass
+
+        content_type, options = parse_options_header(self.content_type or "")
+        limits = FormLimits(**limits)
+
+        if content_type == "multipart/form-data" and "boundary" in options:
+            parser = MultipartParser(options["boundary"].encode("latin-1"), limits)
+            self._form = await parser.parse(self.stream())
+        elif content_type == "application/x-www-form-urlencoded":
+            self._form = await parse_urlencoded(self.stream(), limits)
+        else:
+            self._form = FormData()
+        return self._form
@@ -1,7 +1,42 @@
+from tarantino.concurrency import iterate_in_threadpool
+from tarantino.http.conditional import (
+    if_range_matches,
+    is_not_modified,
+    multipart_boundary,
+    multipart_end,
+    multipart_part_header,
+    parse_range,
+)
+from tarantino.http.constants import (
+    ACCEPT_RANGES,
+    APPLICATION_JSON,
+    BYTES,
+    CONTENT_DISPOSITION,
+    CONTENT_LENGTH,
+    CONTENT_RANGE,
+    CONTENT_TYPE,
+    ETAG,
+    LAST_MODIFIED,
+    LOCATION,
+    TEXT_HTML,
+    TEXT_PLAIN,
+    encode_content_length,
+)
 from tarantino.http.cookie import Cookie
 from tarantino.http.headers import Headers
-from tarantino.http.utils import HTTPStatusCode
-from tarantino.imports import datetime, json, parse, t
+from tarantino.http.utils import STATUS_CODES, HTTPStatusCode
+from tarantino.imports import (
+    asyncio,
+    datetime,
+    formatdate,
+    hashlib,
+    mimetypes,
+    mmap,
+    os,
+    parse,
+    t,
+)
+from tarantino.serialization import JSONCodecs
 
 
 class Response:
@@ -9,12 +44,18 @@ class Response:
     body_encoding = "utf-8"
     default_content_type = None
 
+    # Validators and range support used to answer conditional and range
+    # requests, see `set_etag`, `set_last_modified` and `enable_ranges`.
+    etag: str | None = None
+    last_modified: float | None = None
+    accept_ranges = False
+
     def __init__(
         self,
         body: t.Any,
         status: int,
         headers: Headers | t.Dict[str, str] = None,
-        content_type: str = None,
+        content_type: str | bytes = None,
     ):
         self.body = body
         self.status = status
@@ -28,9 +69,7 @@ class Response:
         self.render()
 
     def assert_status_code(self):
-        return self.status in [
-            getattr(HTTPStatusCode, attr) for attr in dir(HTTPStatusCode)
-        ]
+        return self.status in STATUS_CODES
 
     def add_cookie(
         self,
@@ -90,32 +129,203 @@ class Response:
         return self.body
 
     def render(self):
-        self.body = (
-            self.body
-            if isinstance(self.body, bytes)
-            else str(self.body).encode(self.body_encoding)
-        )
+        body = self.body
+        if isinstance(body, (bytearray, memoryview)):
+            body = bytes(body)
+        elif not isinstance(body, bytes):
+            body = str(body).encode(self.body_encoding)
+        self.body = body
         if self.content_type:
-            self.headers.set("content-type", self.content_type)
-        self.headers.set("content-length", len(self.body))
+            self.headers.set(CONTENT_TYPE, self.content_type)
+        self.headers.set(CONTENT_LENGTH, encode_content_length(len(self.body)))
 
-    async def __call__(self, scope, receive, send):
+    def set_etag(self, etag: str = None, weak: bool = False):
+        """Defaults to a hash of the rendered body."""
+        if etag is None:
+            etag = '"%s"' % hashlib.blake2b(self.body, digest_size=16).hexdigest()
+        if weak and not etag.startswith("W/"):
+            etag = "W/" + etag
+
+        self.etag = etag
+        self.headers.set(ETAG, etag)
+
+    def set_last_modified(self, last_modified: float | datetime):
+        if isinstance(last_modified, datetime):
+            last_modified = last_modified.timestamp()
+
+        self.last_modified = last_modified
+        self.headers.set(LAST_MODIFIED, formatdate(last_modified, usegmt=True))
+
+    def enable_ranges(self):
+        self.accept_ranges = True
+        self.headers.set(ACCEPT_RANGES, BYTES)
+
+    @property
+    def is_conditional(self) -> bool:
+        if self.status != HTTPStatusCode.STATUS_200_OK:
+            return False
+        return (
+            self.etag is not None
+            or self.last_modified is not None
+            or self.accept_ranges
+        )
+
+    def content_size(self) -> int:
+        return len(self.body)
+
+    async def send_content(
+        self, scope, send, start: int, stop: int, more_body: bool = False
+    ):
+        """Send the `[start, stop)` slice of the body."""
+        body = self.body
+        if start != 0 or stop != len(body):
+            body = body[start:stop]
+        await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def send_conditional(self, scope, send):
+        """Answer a GET or HEAD request with 304, 206 or 416 when its
+        conditional and range headers ask for it."""
+        request_headers = Headers(headers_list=scope["headers"])
+
+        def header(name: str) -> str | None:
+            value = request_headers.get(name, decode=True)
+            return ", ".join(value) if isinstance(value, list) else value
+
+        headers = Headers(headers_list=self.get_headers())
+        send_body = scope.get("method") != "HEAD"
+
+        if is_not_modified(
+            header("if-none-match"),
+            header("if-modified-since"),
+            self.etag,
+            self.last_modified,
+        ):
+            headers.pop(CONTENT_LENGTH)
+            headers.pop(CONTENT_TYPE)
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": HTTPStatusCode.STATUS_304_NOT_MODIFIED,
+                    "headers": headers.to_list(),
+                }
+            )
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        size = self.content_size()
+        ranges = None
+        range_header = header("range")
+        if (
+            self.accept_ranges
+            and range_header is not None
+            and if_range_matches(header("if-range"), self.etag, self.last_modified)
+        ):
+            ranges = parse_range(range_header, size)
+
+        if ranges is None:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": self.get_status(),
+                    "headers": headers.to_list(),
+                }
+            )
+            if send_body:
+                await self.send_content(scope, send, 0, size)
+            else:
+                await send({"type": "http.response.body", "body": b""})
+            return
+
+        if not ranges:
+            headers.pop(CONTENT_TYPE)
+            headers.set(CONTENT_LENGTH, encode_content_length(0))
+            headers.set(CONTENT_RANGE, f"bytes */{size}")
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": HTTPStatusCode.STATUS_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                    "headers": headers.to_list(),
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if len(ranges) == 1:
+            start, stop = ranges[0]
+            headers.set(CONTENT_LENGTH, encode_content_length(stop - start))
+            headers.set(CONTENT_RANGE, f"bytes {start}-{stop - 1}/{size}")
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": HTTPStatusCode.STATUS_206_PARTIAL_CONTENT,
+                    "headers": headers.to_list(),
+                }
+            )
+            if send_body:
+                await self.send_content(scope, send, start, stop)
+            else:
+                await send({"type": "http.response.body", "body": b""})
+            return
+
+        boundary = multipart_boundary()
+        content_type = headers.get(CONTENT_TYPE, "", decode=True)
+        part_headers = [
+            multipart_part_header(boundary, content_type, start, stop, size)
+            for start, stop in ranges
+        ]
+        end = multipart_end(boundary)
+        content_length = len(end) + sum(
+            len(part_header) + (stop - start) + 2
+            for part_header, (start, stop) in zip(part_headers, ranges)
+        )
+
+        headers.set(CONTENT_TYPE, f"multipart/byteranges; boundary={boundary}")
+        headers.set(CONTENT_LENGTH, encode_content_length(content_length))
         await send(
             {
                 "type": "http.response.start",
-                "status": self.get_status(),
-                "headers": self.get_headers(),
+                "status": HTTPStatusCode.STATUS_206_PARTIAL_CONTENT,
+                "headers": headers.to_list(),
             }
         )
+        if not send_body:
+            await send({"type": "http.response.body", "body": b""})
+            return
 
-        await send(
+        for part_header, (start, stop) in zip(part_headers, ranges):
+            await send(
+                {"type": "http.response.body", "body": part_header, "more_body": True}
+            )
+            await self.send_content(scope, send, start, stop, more_body=True)
+            await send(
+                {"type": "http.response.body", "body": b"\r\n", "more_body": True}
+            )
+        await send({"type": "http.response.body", "body": end, "more_body": False})
+
+    def messages(self) -> t.Tuple[t.Dict[str, t.Any], t.Dict[str, t.Any]]:
+        """The ASGI start and body messages of this response."""
+        return (
+            {
+                "type": "http.response.start",
+                "status": self.get_status(),
+                "headers": self.get_headers(),
+            },
             {
                 "type": "http.response.body",
                 "body": self.get_body(),
                 "more_body": False,
-            }
+            },
         )
 
+    async def __call__(self, scope, receive, send):
+        if self.is_conditional and scope.get("method") in ("GET", "HEAD"):
+            await self.send_conditional(scope, send)
+            return
+
+        start, body = self.messages()
+        await send(start)
+        await send(body)
+
 
 class PlainTextResponse(Response):
     def __init__(
@@ -128,7 +338,7 @@ class PlainTextResponse(Response):
             body=body,
             status=status,
             headers=headers,
-            content_type="text/plain; charset=utf8",
+            content_type=TEXT_PLAIN,
         )
 
 
@@ -143,7 +353,7 @@ class HTMLResponse(Response):
             body=body,
             status=status,
             headers=headers,
-            content_type="text/html; charset=utf8",
+            content_type=TEXT_HTML,
         )
 
 
@@ -185,10 +395,10 @@ class JSONResponse(Response):
         headers: Headers | t.Dict[str, str] = None,
     ):
         super().__init__(
-            body=json.dumps(body),
+            body=JSONCodecs.dumps(body),
             status=status,
             headers=headers,
-            content_type="application/json",
+            content_type=APPLICATION_JSON,
         )
 
 
@@ -205,6 +415,225 @@ class RedirectResponse(Response):
             headers=headers,
         )
         self.headers.set(
-            "location",
+            LOCATION,
             parse.quote(str(url), safe=":/%#?=@[]!$&'()*+,;"),
         )
+
+
+class StreamingResponse(Response):
+    """Sends the chunks of a sync or async iterator as they are produced.
+
+    Each chunk waits for `send`, which is where the server applies flow
+    control, so at most one chunk is held in memory. The iterator is
+    closed early if the client disconnects.
+    """
+
+    def __init__(
+        self,
+        body: t.AsyncIterable[str | bytes] | t.Iterable[str | bytes],
+        status: int = HTTPStatusCode.STATUS_200_OK,
+        headers: Headers | t.Dict[str, str] = None,
+        content_type: str | bytes = None,
+    ):
+        super().__init__(
+            body=body,
+            status=status,
+            headers=headers,
+            content_type=content_type,
+        )
+
+    def render(self):
+        if not hasattr(self.body, "__aiter__"):
+            self.body = iterate_in_threadpool(self.body)
+        if self.content_type:
+            self.headers.set(CONTENT_TYPE, self.content_type)
+
+    async def stream_body(self, send):
+        try:
+            async for chunk in self.body:
+                if not isinstance(chunk, bytes):
+                    chunk = str(chunk).encode(self.body_encoding)
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": True,
+                    }
+                )
+        finally:
+            aclose = getattr(self.body, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def listen_for_disconnect(self, receive):
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+
+    async def __call__(self, scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.get_status(),
+                "headers": self.get_headers(),
+            }
+        )
+
+        stream = asyncio.ensure_future(self.stream_body(send))
+        disconnect = asyncio.ensure_future(self.listen_for_disconnect(receive))
+        done, pending = await asyncio.wait(
+            [stream, disconnect], return_when=asyncio.FIRST_COMPLETED
+        )
+
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        for task in done:
+            task.result()
+
+
+class FileResponse(Response):
+    """Sends a file in chunks of `chunk_size`.
+
+    The file is handed to the server through the `http.response.pathsend`
+    or `http.response.zerocopy` extensions when the server supports them,
+    and otherwise sent as slices of a memory map. Content length and last
+    modified time come from a single `os.stat`.
+    """
+
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        status: int = HTTPStatusCode.STATUS_200_OK,
+        headers: Headers | t.Dict[str, str] = None,
+        content_type: str | bytes = None,
+        filename: str = None,
+        stat_result: os.stat_result = None,
+    ):
+        self.path = os.path.abspath(path)
+        self.filename = filename
+        self.stat_result = stat_result if stat_result else os.stat(self.path)
+
+        if content_type is None:
+            content_type, _ = mimetypes.guess_type(filename or self.path)
+            content_type = content_type or "application/octet-stream"
+
+        super().__init__(
+            body=b"",
+            status=status,
+            headers=headers,
+            content_type=content_type,
+        )
+
+    def render(self):
+        stat_result = self.stat_result
+        self.headers.set(CONTENT_TYPE, self.content_type)
+        self.headers.set(CONTENT_LENGTH, encode_content_length(stat_result.st_size))
+        self.set_etag(f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"')
+        self.set_last_modified(stat_result.st_mtime)
+        self.enable_ranges()
+        if self.filename:
+            self.headers.set(
+                CONTENT_DISPOSITION,
+                f'attachment; filename="{parse.quote(self.filename)}"',
+            )
+
+    async def send_file(
+        self,
+        scope,
+        send,
+        offset: int = 0,
+        count: int = None,
+        more_body: bool = False,
+    ):
+        """Send `count` bytes of the file starting at `offset`."""
+        size = self.stat_result.st_size
+        count = size - offset if count is None else count
+        extensions = scope.get("extensions") or {}
+
+        if (
+            "http.response.pathsend" in extensions
+            and offset == 0
+            and count == size
+            and not more_body
+        ):
+            await send({"type": "http.response.pathsend", "path": self.path})
+            return
+
+        if count <= 0:
+            await send(
+                {"type": "http.response.body", "body": b"", "more_body": more_body}
+            )
+            return
+
+        with open(self.path, "rb") as file:
+            if "http.response.zerocopy" in extensions:
+                await send(
+                    {
+                        "type": "http.response.zerocopy",
+                        "file": file,
+                        "offset": offset,
+                        "count": count,
+                        "more_body": more_body,
+                    }
+                )
+                return
+
+            # The file may have shrunk since `stat_result` was taken, after
+            # the start message went out, so the map can be shorter than
+            # `offset` or, for an emptied file, impossible to create.
+            end = offset
+            try:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                pass
+            else:
+                with mapped:
+                    end = min(offset + count, len(mapped))
+                    for start in range(offset, end, self.chunk_size):
+                        stop = min(start + self.chunk_size, end)
+                        await send(
+                            {
+                                "type": "http.response.body",
+                                "body": mapped[start:stop],
+                                "more_body": more_body or stop < end,
+                            }
+                        )
+
+        if end <= offset:
+            await send(
+                {"type": "http.response.body", "body": b"", "more_body": more_body}
+            )
+
+    def content_size(self) -> int:
+        return self.stat_result.st_size
+
+    async def send_content(
+        self, scope, send, start: int, stop: int, more_body: bool = False
+    ):
+        await self.send_file(scope, send, start, stop - start, more_body)
+
+    async def __call__(self, scope, receive, send):
+        method = scope.get("method")
+        if self.is_conditional and method in ("GET", "HEAD"):
+            await self.send_conditional(scope, send)
+            return
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.get_status(),
+                "headers": self.get_headers(),
+            }
+        )
+        if method == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        await self.send_file(scope, send)
@@ -1,3 +1,6 @@
+from tarantino.imports import MappingProxyType, t
+
+
 class _HTTPStatusCode:
     STATUS_100_CONTINUE = 100
     STATUS_101_SWITCHING_PROTOCOLS = 101
@@ -64,17 +67,10 @@ class _HTTPStatusCode:
     STATUS_511_NETWORK_AUTHENTICATION_REQUIRED = 511
 
     def get_status_message(self, status_code: int):
-        status_codes = [
-            attr_name for attr_name in dir(self) if attr_name.startswith("STATUS_")
-        ]
-
-        for attr_name in status_codes:
-            if getattr(HTTPStatusCode, attr_name) == status_code:
-                status = attr_name.split("_")
-                status = status[2:]
-                return " ".join(status)
-
-        raise ValueError(f"Invalid status code: {status_code}")
+        try:
+            return STATUS_PHRASES[status_code]
+        except KeyError:
+            raise ValueError(f"Invalid status code: {status_code}") from None
 
     def __dir__(self):
         return [
@@ -106,9 +102,48 @@ class _HTTPMethods:
     TRACE = "TRACE"
     PATCH = "PATCH"
 
+    # The methods handlers can be registered for.
+    methods = ("GET", "HEAD", "POST", "PUT", "DELETE", "OPTIONS", "TRACE", "PATCH")
+
     def __dir__(self):
-        return ["GET", "HEAD", "POST", "PUT", "DELETE", "OPTIONS", "TRACE", "PATCH"]
+        return list(self.methods)
 
 
 HTTPStatusCode = _HTTPStatusCode()
 HTTPMethods = _HTTPMethods()
+
+# Built once so that looking up a status or a method does not scan `dir()`.
+STATUS_PHRASES: t.Mapping[int, str] = MappingProxyType(
+    {
+        value: " ".join(name.split("_")[2:])
+        for name, value in vars(_HTTPStatusCode).items()
+        if name.startswith("STATUS_")
+    }
+)
+STATUS_CODES = frozenset(STATUS_PHRASES)
+HTTP_METHODS = frozenset(HTTPMethods.methods)
+
+
+def parse_accept_encoding(
+    accept_encoding: str,
+) -> t.Tuple[t.Set[str], t.Set[str]]:
+    """The accepted codings of an `Accept-Encoding` header, and the codings
+    it excludes with a zero quality, which are refused even if `*` is
+    accepted."""
+    accepted, excluded = set(), set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        quality = params.strip().lower()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    excluded.add(coding)
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding)
+    return accepted, excluded
@@ -1,10 +1,22 @@
 import asyncio
+import dataclasses
 import enum
 import hashlib
 import json
+import mimetypes
+import mmap
+import os
 import re
+import stat
+import tempfile
+import time
 import typing as t
+import uuid
 import warnings
-from datetime import datetime
+import zlib
+from collections import OrderedDict, namedtuple
+from datetime import date, datetime
+from email.utils import formatdate, parsedate_to_datetime
 from functools import wraps
+from types import MappingProxyType, NoneType, UnionType
 from urllib import parse
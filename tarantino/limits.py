@@ -0,0 +1,27 @@
+from tarantino.http import HTTPRequest
+from tarantino.imports import t, wraps
+from tarantino.types import HTTPHandler
+
+
+def limit_body_size(
+    max_body_size: int | None,
+) -> t.Callable[[HTTPHandler], HTTPHandler]:
+    """Override the app's `max_body_size` for a handler, `None` lifts the
+    limit. A request declaring a larger `content-length` is answered with a
+    413 before the handler runs, and a body found larger while it is
+    streamed aborts the handler with a 413 as well."""
+
+    def _decorator(cb: HTTPHandler) -> HTTPHandler:
+        @wraps(cb)
+        async def _inner(request: HTTPRequest, **kwargs):
+            request.max_body_size = max_body_size
+            request.check_content_length()
+            return await cb(request, **kwargs)
+
+        # Read by `HTTPEndpoint` to check the `content-length` against the
+        # route's limit before dispatching, `wraps` carries it through the
+        # decorators applied on top.
+        _inner.max_body_size = max_body_size
+        return _inner
+
+    return _decorator
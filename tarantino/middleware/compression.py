@@ -0,0 +1,232 @@
+from tarantino.http import Headers, HTTPStatusCode
+from tarantino.http.constants import (
+    CONTENT_ENCODING,
+    CONTENT_LENGTH,
+    CONTENT_RANGE,
+    CONTENT_TYPE,
+    ETAG,
+    VARY,
+    encode_content_length,
+)
+from tarantino.http.utils import parse_accept_encoding
+from tarantino.imports import asyncio, t, zlib
+from tarantino.types import ASGIApp, Message, Middleware, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+# Content types that are already compressed, or that are not worth it.
+EXCLUDED_CONTENT_TYPES = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/zstd",
+    "application/x-brotli",
+    "text/event-stream",
+)
+
+
+class Compressor(t.Protocol):
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """Compress `data` and flush it, the stream ends when `final`."""
+        ...
+
+
+class GzipCompressor:
+    def __init__(self, level: int):
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        flush_mode = zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        return self.compressor.compress(data) + self.compressor.flush(flush_mode)
+
+
+class BrotliCompressor:
+    def __init__(self, level: int):
+        self.compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        out = self.compressor.process(data)
+        return out + (self.compressor.finish() if final else self.compressor.flush())
+
+
+class ZstdCompressor:
+    def __init__(self, level: int):
+        self.compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        flush_mode = (
+            zstandard.COMPRESSOBJ_FLUSH_FINISH
+            if final
+            else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+        return self.compressor.compress(data) + self.compressor.flush(flush_mode)
+
+
+class Compression(Middleware):
+    """Compress response bodies with the best encoding the client accepts,
+    preferring `br`, then `zstd`, then `gzip`. `br` and `zstd` need the
+    optional `brotli` and `zstandard` packages.
+
+    A response sent in one body message is left alone below `minimum_size`
+    bytes. A response streamed over several messages is compressed chunk
+    by chunk, each chunk being flushed so that the client receives it
+    right away. Chunks of at least `threadpool_size` bytes are compressed
+    in a thread so that the event loop is not blocked, `None` disables it.
+    """
+
+    def __init__(
+        self,
+        minimum_size: int = 500,
+        gzip_level: int = 6,
+        brotli_level: int = 4,
+        zstd_level: int = 3,
+        threadpool_size: int | None = 1024 * 1024,
+        excluded_content_types: t.Sequence[str] = EXCLUDED_CONTENT_TYPES,
+    ):
+        self.app: ASGIApp = None
+
+        self.minimum_size = minimum_size
+        self.threadpool_size = threadpool_size
+        self.excluded_content_types = tuple(excluded_content_types)
+
+        self.compressors: t.Dict[str, t.Callable[[], Compressor]] = dict()
+        if brotli is not None:
+            self.compressors["br"] = lambda: BrotliCompressor(brotli_level)
+        if zstandard is not None:
+            self.compressors["zstd"] = lambda: ZstdCompressor(zstd_level)
+        self.compressors["gzip"] = lambda: GzipCompressor(gzip_level)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(headers_list=scope["headers"]).get(
+            "accept-encoding", "", decode=True
+        )
+        if isinstance(accept_encoding, list):
+            accept_encoding = ", ".join(accept_encoding)
+
+        encoding = self.select_encoding(accept_encoding)
+        await self.app(scope, receive, self.compression_send(send, encoding))
+
+    def select_encoding(self, accept_encoding: str) -> str | None:
+        if not accept_encoding:
+            return None
+
+        accepted, excluded = parse_accept_encoding(accept_encoding)
+        for encoding in self.compressors:
+            if encoding in excluded:
+                continue
+            if encoding in accepted or "*" in accepted:
+                return encoding
+        return None
+
+    def should_compress(self, start: Message, headers: Headers) -> bool:
+        status = start["status"]
+        if status < HTTPStatusCode.STATUS_200_OK or status in (
+            HTTPStatusCode.STATUS_204_NO_CONTENT,
+            HTTPStatusCode.STATUS_304_NOT_MODIFIED,
+        ):
+            return False
+        if CONTENT_ENCODING in headers or CONTENT_RANGE in headers:
+            return False
+
+        content_type = headers.get(CONTENT_TYPE, "", decode=True)
+        if isinstance(content_type, list):
+            content_type = content_type[0]
+        return not content_type.lower().startswith(self.excluded_content_types)
+
+    def add_vary(self, headers: Headers):
+        vary = headers.get(VARY, "", decode=True)
+        if isinstance(vary, list):
+            vary = ", ".join(vary)
+        if "accept-encoding" not in vary.lower():
+            headers.set(VARY, "accept-encoding", mode="append")
+
+    async def compress(self, compressor: Compressor, data: bytes, final: bool):
+        if self.threadpool_size is not None and len(data) >= self.threadpool_size:
+            return await asyncio.to_thread(compressor.compress, data, final)
+        return compressor.compress(data, final)
+
+    def compression_send(self, send: Send, encoding: str | None) -> Send:
+        """Responses that could be compressed carry `Vary: accept-encoding`
+        whether they are or not, they are only compressed with `encoding`."""
+        start: Message | None = None
+        headers: Headers | None = None
+        compressor: Compressor | None = None
+        passthrough = False
+
+        async def _wrapper(message: Message):
+            nonlocal start, headers, compressor, passthrough
+
+            if passthrough:
+                await send(message)
+                return
+
+            message_type = message["type"]
+            if message_type == "http.response.start":
+                headers = Headers(headers_list=message["headers"])
+                negotiable = self.should_compress(message, headers)
+                if negotiable:
+                    self.add_vary(headers)
+                    message = {**message, "headers": headers.to_list()}
+                if negotiable and encoding is not None:
+                    # Held back until the first body message tells whether
+                    # the response is streamed and how large it is.
+                    start = message
+                else:
+                    passthrough = True
+                    await send(message)
+                return
+
+            if message_type != "http.response.body":
+                passthrough = True
+                if start is not None:
+                    await send(start)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+
+                compressor = self.compressors[encoding]()
+                headers.set(CONTENT_ENCODING, encoding)
+
+                etag = headers.get(ETAG, decode=True)
+                if isinstance(etag, str) and not etag.startswith("W/"):
+                    headers.set(ETAG, "W/" + etag)
+
+                body = await self.compress(compressor, body, not more_body)
+                if more_body:
+                    headers.pop(CONTENT_LENGTH)
+                else:
+                    headers.set(CONTENT_LENGTH, encode_content_length(len(body)))
+
+                await send({**start, "headers": headers.to_list()})
+                await send({**message, "body": body})
+                return
+
+            body = await self.compress(compressor, body, not more_body)
+            await send({**message, "body": body})
+
+        return _wrapper
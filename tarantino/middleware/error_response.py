@@ -1,4 +1,10 @@
 from tarantino.http import Headers, HTTPStatusCode
+from tarantino.http.constants import (
+    CONTENT_LENGTH,
+    CONTENT_TYPE,
+    TEXT_HTML,
+    encode_content_length,
+)
 from tarantino.types import ASGIApp, Message, Middleware, Send
 
 response_template = """
@@ -87,8 +93,8 @@ class ErrorResponse(Middleware):
                 )
                 response = response.encode("utf-8")
 
-                headers.set("content-length", len(response))
-                headers.set("content-type", "text/html; charset=utf8")
+                headers.set(CONTENT_LENGTH, encode_content_length(len(response)))
+                headers.set(CONTENT_TYPE, TEXT_HTML)
 
                 message = {
                     "type": "http.response.start",
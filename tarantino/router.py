@@ -1,12 +1,20 @@
 from tarantino.casts import CastRegistry
 from tarantino.endpoint import Endpoint
-from tarantino.imports import re, t
+from tarantino.imports import MappingProxyType, OrderedDict, namedtuple, parse, re, t
 from tarantino.types import CastType
 
 PARAM_PATTERN = re.compile(r"{([a-zA-Z_][a-zA-Z0-9_]*)(:[a-zA-Z_][a-zA-Z0-9_]*)?}")
+FORMAT_PARAM_PATTERN = re.compile(r"{([a-zA-Z_][a-zA-Z0-9_]*)}")
+NO_PARAMS: t.Mapping[str, t.Any] = MappingProxyType({})
 
+RouteCacheInfo = namedtuple(
+    "RouteCacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
 
-def compile_path(path: str) -> t.Tuple[re.Pattern[str], str, t.Dict[str, CastType]]:
+
+def compile_path(
+    path: str, group_prefix: str = ""
+) -> t.Tuple[re.Pattern[str], str, t.Dict[str, CastType]]:
     path_pattern = "^"
     path_format = ""
     param_casts = dict()
@@ -28,10 +36,10 @@ def compile_path(path: str) -> t.Tuple[re.Pattern[str], str, t.Dict[str, CastTyp
         param_casts[param_name] = cast
 
         path_pattern += re.escape(path[idx : match.start()])
-        path_pattern += f"(?P<{param_name}>{cast.pattern})"
+        path_pattern += f"(?P<{group_prefix}{param_name}>{cast.pattern})"
 
         path_format += path[idx : match.start()]
-        path_format += f"{param_name}"
+        path_format += f"{{{param_name}}}"
 
         idx = match.end()
 
@@ -49,12 +57,123 @@ def compile_path(path: str) -> t.Tuple[re.Pattern[str], str, t.Dict[str, CastTyp
     )
 
 
+ParamParsers = t.Tuple[t.Tuple[int, str, t.Callable[[str], t.Any]], ...]
+
+
+def compile_params(
+    path_pattern: re.Pattern[str],
+    param_casts: t.Dict[str, CastType],
+    group_prefix: str = "",
+) -> ParamParsers:
+    """Precompile the `(group_index, name, parse)` triples of the params of
+    `path_pattern`, so that a match is converted with a loop over its
+    groups."""
+    return tuple(
+        (path_pattern.groupindex[group_prefix + name], name, cast.parse)
+        for name, cast in param_casts.items()
+    )
+
+
+def parse_params(
+    match: re.Match[str], param_parsers: ParamParsers
+) -> t.Dict[str, t.Any]:
+    """Raises `ValueError` if a cast rejects the matched value."""
+    group = match.group
+    return {name: parse(group(idx)) for idx, name, parse in param_parsers}
+
+
+def compile_formatter(
+    path_format: str, param_casts: t.Dict[str, CastType]
+) -> t.Callable[..., str]:
+    """Compile `path_format` into a function building the path from params,
+    values are converted with the casts' `to_str` and percent-encoded."""
+    parts: t.List[t.Tuple[str, t.Callable[[t.Any], str] | None, str]] = list()
+
+    idx = 0
+    for match in FORMAT_PARAM_PATTERN.finditer(path_format):
+        param_name = match.group(1)
+        if param_name not in param_casts:
+            continue
+
+        cast = param_casts[param_name]
+        parts.append((path_format[idx : match.start()], None, ""))
+        parts.append((param_name, cast.to_str, "/" if cast.multi_segment else ""))
+        idx = match.end()
+
+    parts.append((path_format[idx:], None, ""))
+    parts = tuple(part for part in parts if part[0])
+    param_count = len(param_casts)
+    quote = parse.quote
+
+    def formatter(**params: t.Any) -> str:
+        if len(params) != param_count:
+            names = ", ".join(sorted(set(params) ^ set(param_casts)))
+            raise ValueError(f"Params do not match the path: {names}")
+
+        try:
+            return "".join(
+                [
+                    part if to_str is None else quote(to_str(params[part]), safe=safe)
+                    for part, to_str, safe in parts
+                ]
+            )
+        except KeyError as e:
+            raise ValueError(f"Missing param: {e.args[0]}") from None
+
+    return formatter
+
+
+def segment_specificity(segment: str) -> t.Tuple[int, int, int]:
+    """Sort key of a path segment.
+
+    Static segments sort first, then dynamic segments by the specificity of
+    their casts and by the length of their literal text.
+    """
+    _, segment_format, segment_casts = compile_path(segment)
+    if not segment_casts:
+        return (0, 0, 0)
+
+    literal = FORMAT_PARAM_PATTERN.sub("", segment_format)
+    specificity = min(cast.specificity for cast in segment_casts.values())
+    return (1, -specificity, -len(literal))
+
+
+# Closes the sort key of a route with a multi-segment cast, so that it sorts
+# after the routes sharing its prefix that have more segments after the cast.
+ROUTE_END = (2, 0, 0)
+
+
+def route_specificity(route: "Route") -> t.Tuple[t.Tuple[int, int, int], ...]:
+    specificity = tuple(
+        segment_specificity(segment) for segment in route.path.split("/")
+    )
+    if any(cast.multi_segment for cast in route.param_casts.values()):
+        return specificity + (ROUTE_END,)
+    return specificity
+
+
+def route_signature(route: "Route") -> str:
+    """The path with every param replaced by its cast pattern, routes sharing
+    a signature match exactly the same URIs."""
+    return PARAM_PATTERN.sub(
+        lambda match: "{:%s}" % route.param_casts[match.group(1)].pattern,
+        route.path,
+    )
+
+
 class Route:
     def __init__(self, path: str):
         self.path = path
         self._endpoint = None
+        self._formatter = None
         self.setup_route()
 
+    @property
+    def formatter(self) -> t.Callable[..., str]:
+        if self._formatter is None:
+            self._formatter = compile_formatter(self.path_format, self.param_casts)
+        return self._formatter
+
     @property
     def endpoint(self) -> Endpoint:
         return self._endpoint
@@ -75,6 +194,8 @@ class Route:
             self.path_format,
             self.param_casts,
         ) = compile_path(self.path)
+        self.param_parsers = compile_params(self.path_pattern, self.param_casts)
+        self._formatter = None
 
     def append_path(
         self,
@@ -129,6 +250,8 @@ class Route:
         self.path_pattern = re.compile(path_pattern)
         self.path_format = path_format
         self.param_casts = param_casts
+        self.param_parsers = compile_params(self.path_pattern, self.param_casts)
+        self._formatter = None
 
     def match_uri(
         self, uri: str
@@ -137,18 +260,384 @@ class Route:
         if not match:
             return None, None
 
-        params = match.groupdict()
-        for name, value in params.items():
-            params[name] = self.param_casts[name].parse(value)
+        try:
+            params = parse_params(match, self.param_parsers)
+        except ValueError:
+            return None, None
 
         return self.endpoint, params
 
 
-class Router:
+class RouteNode:
+    """A single path segment in the `RouteTrie`.
+
+    Static children are keyed by the literal segment, dynamic children
+    keep the per-segment output of `compile_path` and are tried in order
+    of `segment_specificity`. Routes whose remaining segments contain a
+    multi-segment cast are kept as tails matched against the rest of the
+    path, in order of `route_specificity`.
+    """
+
+    def __init__(self):
+        self.static: t.Dict[str, "RouteNode"] = dict()
+        self.dynamic: t.List[
+            t.Tuple[
+                t.Tuple[int, int, int],
+                re.Pattern[str],
+                ParamParsers,
+                "RouteNode",
+            ]
+        ] = list()
+        self.tails: t.List[
+            t.Tuple[
+                t.Tuple[t.Tuple[int, int, int], ...],
+                re.Pattern[str],
+                ParamParsers,
+                Route,
+            ]
+        ] = list()
+        self.route: Route | None = None
+
+    def static_child(self, segment: str) -> "RouteNode":
+        return self.static.setdefault(segment, RouteNode())
+
+    def dynamic_child(
+        self,
+        segment: str,
+        segment_pattern: re.Pattern[str],
+        segment_casts: t.Dict[str, CastType],
+    ) -> "RouteNode":
+        for _, pattern, _, child in self.dynamic:
+            if pattern.pattern == segment_pattern.pattern:
+                return child
+
+        child = RouteNode()
+        specificity = segment_specificity(segment)
+        segment_parsers = compile_params(segment_pattern, segment_casts)
+        self.dynamic.append((specificity, segment_pattern, segment_parsers, child))
+        self.dynamic.sort(key=lambda item: item[0])
+        return child
+
+    def add_tail(self, tail: str, route: Route):
+        tail_pattern, _, tail_casts = compile_path(tail)
+        tail_parsers = compile_params(tail_pattern, tail_casts)
+        self.tails.append((route_specificity(route), tail_pattern, tail_parsers, route))
+        self.tails.sort(key=lambda item: item[0])
+
+
+class RouteTrie:
+    """Prefix tree of routes split on `/`, so that the cost of a lookup
+    depends on the depth of the path rather than on the number of
+    routes."""
+
+    def __init__(self):
+        self.root = RouteNode()
+
+    def insert(self, route: Route):
+        node = self.root
+        segments = route.path.split("/")
+
+        for idx, segment in enumerate(segments):
+            segment_pattern, _, segment_casts = compile_path(segment)
+            if any(cast.multi_segment for cast in segment_casts.values()):
+                node.add_tail("/".join(segments[idx:]), route)
+                return
+
+            if segment_casts:
+                node = node.dynamic_child(segment, segment_pattern, segment_casts)
+            else:
+                node = node.static_child(segment)
+
+        node.route = route
+
+    def match(
+        self, uri: str
+    ) -> t.Tuple[Endpoint, t.Dict[str, t.Any]] | t.Tuple[None, None]:
+        params = dict()
+        route = self._match(self.root, uri.split("/"), 0, params)
+        if route is None:
+            return None, None
+        return route.endpoint, params
+
+    def _match(
+        self,
+        node: RouteNode,
+        segments: t.List[str],
+        idx: int,
+        params: t.Dict[str, t.Any],
+    ) -> Route | None:
+        if idx == len(segments):
+            if node.route is not None and node.route.endpoint:
+                return node.route
+            return None
+
+        segment = segments[idx]
+
+        child = node.static.get(segment)
+        if child is not None:
+            route = self._match(child, segments, idx + 1, params)
+            if route is not None:
+                return route
+
+        for _, pattern, parsers, child in node.dynamic:
+            match = pattern.match(segment)
+            if not match:
+                continue
+
+            try:
+                segment_params = parse_params(match, parsers)
+            except ValueError:
+                continue
+
+            route = self._match(child, segments, idx + 1, params)
+            if route is not None:
+                params.update(segment_params)
+                return route
+
+        if node.tails:
+            tail = "/".join(segments[idx:])
+            for _, pattern, parsers, route in node.tails:
+                match = pattern.match(tail)
+                if not match or not route.endpoint:
+                    continue
+
+                try:
+                    params.update(parse_params(match, parsers))
+                except ValueError:
+                    continue
+                return route
+
+        return None
+
+
+class RouteRegex:
+    """All routes compiled into one alternation regex with a marker group per
+    route, `match.lastgroup` identifies the matched route in a single
+    regex pass."""
+
+    def __init__(self):
+        self.routes: t.List[Route] = list()
+        self._pattern: re.Pattern[str] | None = None
+        self._route_groups: t.Dict[str, t.Tuple[int, Route, ParamParsers]] = dict()
+
+    def insert(self, route: Route):
+        self.routes.append(route)
+        self._pattern = None
+
+    def compile(self):
+        alternatives = []
+
+        for idx, route in enumerate(self.routes):
+            route_group = f"_r{idx}"
+            route_pattern, _, _ = compile_path(route.path, f"{route_group}_")
+            # An empty marker group at the end of each branch closes last, so
+            # it becomes `match.lastgroup`. Wrapping the whole branch in a
+            # group instead stops `re` from skipping branches on their prefix.
+            alternatives.append(f"{route_pattern.pattern[1:-1]}(?P<{route_group}>)")
+
+        pattern = re.compile("^(?:" + "|".join(alternatives) + ")$")
+
+        route_groups = dict()
+        for idx, route in enumerate(self.routes):
+            route_group = f"_r{idx}"
+            route_groups[route_group] = (
+                idx,
+                route,
+                compile_params(pattern, route.param_casts, f"{route_group}_"),
+            )
+
+        self._pattern = pattern
+        self._route_groups = route_groups
+
+    def match(
+        self, uri: str
+    ) -> t.Tuple[Endpoint, t.Dict[str, t.Any]] | t.Tuple[None, None]:
+        if self._pattern is None:
+            self.compile()
+
+        match = self._pattern.match(uri)
+        if not match or match.lastgroup is None:
+            return None, None
+
+        idx, route, param_parsers = self._route_groups[match.lastgroup]
+        if route.endpoint:
+            try:
+                return route.endpoint, parse_params(match, param_parsers)
+            except ValueError:
+                pass
+
+        # A cast rejected the value, the routes after it are tried one by one
+        # as `RouteList` does, so that every matcher resolves the same route.
+        for route in self.routes[idx + 1 :]:
+            endpoint, params = route.match_uri(uri)
+            if endpoint:
+                return endpoint, params
+
+        return None, None
+
+
+class RouteList:
+    """Tries every route's own regex in insertion order."""
+
     def __init__(self):
+        self.routes: t.List[Route] = list()
+
+    def insert(self, route: Route):
+        self.routes.append(route)
+
+    def match(
+        self, uri: str
+    ) -> t.Tuple[Endpoint, t.Dict[str, t.Any]] | t.Tuple[None, None]:
+        for route in self.routes:
+            endpoint, kwargs = route.match_uri(uri)
+            if endpoint:
+                return endpoint, kwargs
+
+        return None, None
+
+
+RouteMatcher = RouteTrie | RouteRegex | RouteList
+
+ROUTE_MATCHERS: t.Dict[str, t.Type[RouteMatcher]] = {
+    "trie": RouteTrie,
+    "regex": RouteRegex,
+    "linear": RouteList,
+}
+
+
+class Router:
+    def __init__(
+        self,
+        matcher: t.Literal["trie", "regex", "linear"] = "trie",
+        cache_size: int = 0,
+    ):
+        """`cache_size` bounds the LRU cache of resolved URIs, which is
+        disabled when it is 0."""
+        if matcher not in ROUTE_MATCHERS:
+            raise ValueError(f"Invalid route matcher: {matcher}")
+        if cache_size < 0:
+            raise ValueError(f"Invalid cache size: {cache_size}")
+
         self.routes: t.Dict[str, Route] = dict()
+        self.named_routes: t.Dict[str, Route] = dict()
+        self.static_routes: t.Dict[str, Endpoint] = dict()
+        self.frozen = False
+        self.matcher_type = matcher
+        self._matcher: RouteMatcher | None = None
+
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, t.Tuple[Endpoint, t.Dict[str, t.Any]]] = (
+            OrderedDict()
+        )
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+
+    @property
+    def matcher(self) -> RouteMatcher:
+        if self._matcher is None:
+            matcher = ROUTE_MATCHERS[self.matcher_type]()
+            for route in self.sorted_routes():
+                matcher.insert(route)
+            if hasattr(matcher, "compile"):
+                matcher.compile()
+            self._matcher = matcher
+        return self._matcher
+
+    def sorted_routes(self) -> t.List[Route]:
+        """Routes in the order they are tried, most specific first."""
+        return sorted(self.routes.values(), key=route_specificity)
+
+    def check_routes(self):
+        """Raise for routes that can never match because an earlier route
+        matches exactly the same URIs, or because the multi-segment cast of
+        an earlier route matches the whole of their path."""
+        signatures: t.Dict[str, Route] = dict()
+        multi_segment_routes: t.List[Route] = list()
+        shadowed = list()
+
+        for route in self.sorted_routes():
+            signature = route_signature(route)
+            # The params of `route` are left as `{name}`, which only the
+            # catch-all casts of the earlier route can match.
+            swallowed_by = next(
+                (
+                    other
+                    for other in multi_segment_routes
+                    if other.path_pattern.match(route.path)
+                ),
+                None,
+            )
+            if signature in signatures:
+                shadowed.append(f"{route.path} (by {signatures[signature].path})")
+            elif swallowed_by is not None:
+                shadowed.append(f"{route.path} (by {swallowed_by.path})")
+            else:
+                signatures[signature] = route
+
+            if any(cast.multi_segment for cast in route.param_casts.values()):
+                multi_segment_routes.append(route)
+
+        if shadowed:
+            raise ValueError(f"Found routes that never match: {', '.join(shadowed)}")
+
+    def describe(self) -> str:
+        """A table of the compiled routes in the order they are tried."""
+        rows = [("#", "path", "methods", "pattern")]
+
+        for idx, route in enumerate(self.sorted_routes()):
+            allowed_methods = getattr(route.endpoint, "allowed_methods", None)
+            methods = (
+                ", ".join(sorted(allowed_methods))
+                if allowed_methods is not None
+                else type(route.endpoint).__name__
+            )
+            rows.append((str(idx), route.path, methods, route.path_pattern.pattern))
+
+        widths = [max(len(row[col]) for row in rows) for col in range(3)]
+        return "\n".join(
+            "  ".join(cell.ljust(width) for cell, width in zip(row, widths))
+            + "  "
+            + row[3]
+            for row in rows
+        )
+
+    def freeze(self):
+        """Build the dispatch tables once, no routes can be added after.
+
+        Routes without any params are put in `static_routes` so that
+        they are dispatched with a single dict lookup.
+        """
+        if self.frozen:
+            return
+
+        self.check_routes()
+
+        self.static_routes = {
+            path: route.endpoint
+            for path, route in self.routes.items()
+            if not route.param_casts and route.endpoint
+        }
+        self.matcher
+        self.frozen = True
+
+    def invalidate(self):
+        if self.frozen:
+            raise RuntimeError("Cannot modify routes of a frozen router.")
+        self._matcher = None
+        self._cache.clear()
+
+    def cache_info(self) -> RouteCacheInfo:
+        return RouteCacheInfo(
+            self._cache_hits,
+            self._cache_misses,
+            self._cache_evictions,
+            self.cache_size,
+            len(self._cache),
+        )
 
     def add_endpoint(self, path: str, endpoint: Endpoint):
+        self.invalidate()
         route = self.routes.setdefault(path, Route(path))
         route.endpoint = endpoint
 
@@ -165,7 +654,19 @@ class Router:
             self.add_endpoint(path, default)
             return default
 
+    def name_route(self, name: str, path: str):
+        route = self.routes[path]
+        if self.named_routes.setdefault(name, route) is not route:
+            raise ValueError(f"Route name already in use: {name}")
+
+    def url_for(self, name: str, /, **params: t.Any) -> str:
+        route = self.named_routes.get(name)
+        if route is None:
+            raise ValueError(f"No route named: {name}")
+        return route.formatter(**params)
+
     def _add_route(self, route: Route):
+        self.invalidate()
         if route.path in self.routes:
             self.routes[route.path].endpoint = route.endpoint
         else:
@@ -173,16 +674,37 @@ class Router:
 
     def match_uri(
         self, uri: str
-    ) -> t.Tuple[Endpoint, t.Dict[str, t.Any]] | t.Tuple[None, None]:
-        for route in self.routes.values():
-            endpoint, kwargs = route.match_uri(uri)
-            if endpoint:
-                return endpoint, kwargs
-
-        return None, None
+    ) -> t.Tuple[Endpoint, t.Mapping[str, t.Any]] | t.Tuple[None, None]:
+        endpoint = self.static_routes.get(uri)
+        if endpoint is not None:
+            return endpoint, NO_PARAMS
+
+        if not self.cache_size:
+            return self.matcher.match(uri)
+
+        cache = self._cache
+        resolved = cache.get(uri)
+        if resolved is not None:
+            cache.move_to_end(uri)
+            self._cache_hits += 1
+            return resolved
+
+        self._cache_misses += 1
+        resolved = self.matcher.match(uri)
+
+        # Misses are not cached, so that probes for random paths cannot
+        # evict the hot entries.
+        if resolved[0] is not None:
+            cache[uri] = resolved
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+                self._cache_evictions += 1
+
+        return resolved
 
     def merge_router(self, path_prefix: str, o: "Router"):
         assert not path_prefix.endswith("/")
+        o.invalidate()
 
         (
             prefix_pattern,
@@ -198,3 +720,86 @@ class Router:
                 prefix_casts,
             )
             self._add_route(route)
+
+        for name, route in o.named_routes.items():
+            self.name_route(name, route.path)
+
+
+class HostRouter:
+    """Picks the `Router` of a request from its host, exact hosts are looked
+    up in a dict and host patterns such as `{tenant}.example.com` are
+    tried in registration order."""
+
+    def __init__(self, router_factory: t.Callable[[], Router] = Router):
+        self.router_factory = router_factory
+        self.static_hosts: t.Dict[str, Router] = dict()
+        self.dynamic_hosts: t.List[
+            t.Tuple[str, re.Pattern[str], ParamParsers, Router]
+        ] = list()
+
+    def __bool__(self):
+        return bool(self.static_hosts or self.dynamic_hosts)
+
+    @property
+    def routers(self) -> t.Dict[str, Router]:
+        routers = dict(self.static_hosts)
+        for host, _, _, router in self.dynamic_hosts:
+            routers[host] = router
+        return routers
+
+    def router_for(self, host: str) -> Router:
+        host_pattern, _, host_casts = compile_path(host)
+
+        if not host_casts:
+            host = host.lower()
+            if host not in self.static_hosts:
+                self.static_hosts[host] = self.router_factory()
+            return self.static_hosts[host]
+
+        for dynamic_host, _, _, router in self.dynamic_hosts:
+            if dynamic_host == host:
+                return router
+
+        router = self.router_factory()
+        host_parsers = compile_params(host_pattern, host_casts)
+        self.dynamic_hosts.append((host, host_pattern, host_parsers, router))
+        return router
+
+    def match_host(
+        self, host: str
+    ) -> t.Tuple[Router, t.Mapping[str, t.Any]] | t.Tuple[None, None]:
+        router = self.static_hosts.get(host)
+        if router is not None:
+            return router, NO_PARAMS
+
+        for _, pattern, parsers, router in self.dynamic_hosts:
+            match = pattern.match(host)
+            if not match:
+                continue
+
+            try:
+                return router, parse_params(match, parsers)
+            except ValueError:
+                continue
+
+        return None, None
+
+    def freeze(self):
+        for router in self.routers.values():
+            router.freeze()
+
+
+def get_host(scope) -> str:
+    """The lowercased `host` header of `scope` without the port."""
+    for key, value in scope["headers"]:
+        if key == b"host":
+            host = value.decode("latin-1").lower()
+            break
+    else:
+        return ""
+
+    if host.endswith("]"):
+        return host
+
+    name, _, port = host.rpartition(":")
+    return name if name and port.isdigit() else host
@@ -0,0 +1,145 @@
+from tarantino.imports import dataclasses, date, enum, json, t, uuid
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+def default(obj: t.Any) -> t.Any:
+    """Serializer for the types the JSON libraries do not all support."""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JSONCodec:
+    """Encodes straight to UTF-8 `bytes` and decodes bytes-like objects or
+    `str`, raising `ValueError` for invalid documents."""
+
+    @staticmethod
+    def dumps(obj: t.Any) -> bytes:
+        ...
+
+    @staticmethod
+    def loads(data: bytes | str) -> t.Any:
+        ...
+
+
+class StdlibCodec(JSONCodec):
+    encoder = json.JSONEncoder(
+        default=default, ensure_ascii=False, separators=(",", ":")
+    )
+
+    @staticmethod
+    def dumps(obj: t.Any) -> bytes:
+        return StdlibCodec.encoder.encode(obj).encode("utf-8")
+
+    @staticmethod
+    def loads(data: bytes | str) -> t.Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    @staticmethod
+    def dumps(obj: t.Any) -> bytes:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+    @staticmethod
+    def loads(data: bytes | str) -> t.Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    encoder = msgspec.json.Encoder(enc_hook=default) if msgspec else None
+    decoder = msgspec.json.Decoder() if msgspec else None
+
+    @staticmethod
+    def dumps(obj: t.Any) -> bytes:
+        return MsgspecCodec.encoder.encode(obj)
+
+    @staticmethod
+    def loads(data: bytes | str) -> t.Any:
+        try:
+            return MsgspecCodec.decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+class UjsonCodec(JSONCodec):
+    @staticmethod
+    def dumps(obj: t.Any) -> bytes:
+        return ujson.dumps(obj, default=default, ensure_ascii=False).encode("utf-8")
+
+    @staticmethod
+    def loads(data: bytes | str) -> t.Any:
+        if not isinstance(data, (bytes, str)):
+            data = bytes(data)
+        return ujson.loads(data)
+
+
+class _JSONCodecRegistry:
+    """`JSONCodecs` holds the JSON codecs used for requests, responses and
+    websockets. The fastest installed one of `orjson`, `msgspec` and
+    `ujson` is used by default, falling back to the standard library."""
+
+    def __init__(self):
+        self.codecs: t.Dict[str, JSONCodec] = dict()
+        self.setup_default_codecs()
+        self.use(next(iter(self.codecs)))
+
+    def setup_default_codecs(self):
+        if orjson is not None:
+            self.register_codec("orjson", OrjsonCodec)
+        if msgspec is not None:
+            self.register_codec("msgspec", MsgspecCodec)
+        if ujson is not None:
+            self.register_codec("ujson", UjsonCodec)
+        self.register_codec("json", StdlibCodec)
+
+    def register_codec(self, codec_name: str, codec: JSONCodec):
+        assert issubclass(codec, JSONCodec)
+        self.codecs[codec_name] = codec
+
+    def use(self, codec_name: str):
+        codec = self.codecs.get(codec_name)
+        if codec is None:
+            raise ValueError(f"Unknown or not installed JSON codec: {codec_name}")
+
+        self.codec_name = codec_name
+        # Bound here so that encoding and decoding is a single call.
+        self.dumps = codec.dumps
+        self.loads = codec.loads
+
+    def __getitem__(self, name: str):
+        return self.codecs[name]
+
+    def get(self, codec_name: str, default: t.Any = None):
+        return self.codecs.get(codec_name, default)
+
+
+JSONCodecs = _JSONCodecRegistry()
+
+
+def use_json_codec(codec_name: str):
+    """Select the JSON codec of the whole process, it is shared by every
+    app like the casts are."""
+    JSONCodecs.use(codec_name)
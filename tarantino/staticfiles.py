@@ -0,0 +1,170 @@
+from tarantino.http import (
+    FileResponse,
+    HTTP404Response,
+    HTTPRequest,
+    HTTPResponse,
+    HTTPStatusCode,
+)
+from tarantino.http.utils import parse_accept_encoding
+from tarantino.imports import OrderedDict, asyncio, mimetypes, os, stat, t
+
+# Precompressed siblings looked up next to a file, in order of preference.
+PRECOMPRESSED_SUFFIXES = [("br", ".br"), ("gzip", ".gz")]
+
+
+class CachedFile(t.NamedTuple):
+    mtime_ns: int
+    size: int
+    response: HTTPResponse
+
+
+class StaticFiles:
+    """Handler serving the files under `directory`, mounted on a
+    `{path:path}` route by `Tarantino.mount_static`.
+
+    Files up to `max_file_size` bytes are kept in memory as fully rendered
+    responses, in an LRU bounded to `max_cache_size` bytes. An entry is
+    dropped when the `st_mtime_ns` or size of its file changes. Larger files
+    are sent with `FileResponse`. With `precompressed`, a `.br` or `.gz`
+    sibling of the file is served when the client accepts that encoding.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        *,
+        precompressed: bool = True,
+        max_cache_size: int = 16 * 1024 * 1024,
+        max_file_size: int = 256 * 1024,
+    ):
+        self.directory = os.path.realpath(directory)
+        self.precompressed = precompressed
+        self.max_cache_size = max_cache_size
+        self.max_file_size = min(max_file_size, max_cache_size)
+
+        self.cache: t.OrderedDict[str, CachedFile] = OrderedDict()
+        self.cache_size = 0
+
+        if not os.path.isdir(self.directory):
+            raise ValueError(f"Static directory does not exist: {directory}")
+
+    def resolve(self, path: str) -> str | None:
+        """Absolute path of `path` inside the directory, or `None` if it
+        points outside of it."""
+        if "\x00" in path:
+            return None
+
+        full_path = os.path.realpath(os.path.join(self.directory, path.lstrip("/")))
+        if os.path.commonpath([self.directory, full_path]) != self.directory:
+            return None
+        return full_path
+
+    def stat_file(self, path: str) -> os.stat_result | None:
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return None
+        return stat_result if stat.S_ISREG(stat_result.st_mode) else None
+
+    def lookup(
+        self, full_path: str, accept_encoding: str
+    ) -> t.Tuple[str, os.stat_result, str | None] | None:
+        """The file to send as `(path, stat_result, content_encoding)`."""
+        if self.precompressed and accept_encoding:
+            accepted, excluded = parse_accept_encoding(accept_encoding)
+            for encoding, suffix in PRECOMPRESSED_SUFFIXES:
+                if encoding not in accepted or encoding in excluded:
+                    continue
+                stat_result = self.stat_file(full_path + suffix)
+                if stat_result is not None:
+                    return full_path + suffix, stat_result, encoding
+
+        stat_result = self.stat_file(full_path)
+        if stat_result is None:
+            return None
+        return full_path, stat_result, None
+
+    def headers(self, content_encoding: str | None) -> t.Dict[str, str]:
+        headers = dict()
+        if self.precompressed:
+            headers["vary"] = "accept-encoding"
+        if content_encoding is not None:
+            headers["content-encoding"] = content_encoding
+        return headers
+
+    def cache_get(self, path: str, stat_result: os.stat_result) -> HTTPResponse | None:
+        entry = self.cache.get(path)
+        if entry is None:
+            return None
+
+        if (
+            entry.mtime_ns != stat_result.st_mtime_ns
+            or entry.size != stat_result.st_size
+        ):
+            self.cache_pop(path)
+            return None
+
+        self.cache.move_to_end(path)
+        return entry.response
+
+    def cache_set(self, path: str, stat_result: os.stat_result, response: HTTPResponse):
+        self.cache_pop(path)
+        self.cache[path] = CachedFile(
+            stat_result.st_mtime_ns, stat_result.st_size, response
+        )
+        self.cache_size += stat_result.st_size
+
+        while self.cache_size > self.max_cache_size:
+            _, entry = self.cache.popitem(last=False)
+            self.cache_size -= entry.size
+
+    def cache_pop(self, path: str):
+        entry = self.cache.pop(path, None)
+        if entry is not None:
+            self.cache_size -= entry.size
+
+    def read(self, path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+    async def __call__(self, request: HTTPRequest, path: str) -> HTTPResponse:
+        accept_encoding = request.headers.get("accept-encoding", "", decode=True)
+        if isinstance(accept_encoding, list):
+            accept_encoding = ", ".join(accept_encoding)
+
+        full_path = self.resolve(path)
+        found = None
+        if full_path is not None:
+            found = self.lookup(full_path, accept_encoding)
+        if found is None:
+            return HTTP404Response()
+
+        file_path, stat_result, content_encoding = found
+        response = self.cache_get(file_path, stat_result)
+        if response is not None:
+            return response
+
+        content_type, _ = mimetypes.guess_type(full_path)
+        content_type = content_type or "application/octet-stream"
+        headers = self.headers(content_encoding)
+
+        if stat_result.st_size > self.max_file_size:
+            return FileResponse(
+                file_path,
+                headers=headers,
+                content_type=content_type,
+                stat_result=stat_result,
+            )
+
+        body = await asyncio.to_thread(self.read, file_path)
+        response = HTTPResponse(
+            body, HTTPStatusCode.STATUS_200_OK, headers, content_type=content_type
+        )
+        response.set_etag(f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"')
+        response.set_last_modified(stat_result.st_mtime)
+        response.enable_ranges()
+
+        # The file may have changed while it was read.
+        if len(body) == stat_result.st_size:
+            self.cache_set(file_path, stat_result, response)
+        return response
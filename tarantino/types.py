@@ -29,6 +29,10 @@ T = t.TypeVar("T")
 
 class CastType(t.Generic[T]):
     pattern: str = ""
+    # Dynamic segments with a higher specificity are tried first.
+    specificity: int = 1
+    # Whether the pattern can span several path segments.
+    multi_segment: bool = False
 
     @staticmethod
     def parse(value: str) -> T:
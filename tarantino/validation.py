@@ -0,0 +1,433 @@
+from tarantino.http import HTTPRequest, HTTPResponse, HTTPStatusCode, JSONResponse
+from tarantino.http.constants import APPLICATION_JSON
+from tarantino.imports import (
+    NoneType,
+    UnionType,
+    dataclasses,
+    date,
+    datetime,
+    t,
+    uuid,
+    wraps,
+)
+from tarantino.serialization import JSONCodecs
+from tarantino.types import HTTPHandler
+
+Loc = t.Tuple[str | int, ...]
+
+MISSING = object()
+
+# Types decoded by checking the exact type of the value, keeping it as is.
+EXACT_TYPES = {int: "int", str: "str", bool: "bool", NoneType: "NoneType"}
+
+# Types decoded from their string form.
+STRING_TYPES = {
+    datetime: "datetime.fromisoformat",
+    date: "date.fromisoformat",
+    uuid.UUID: "uuid.UUID",
+}
+
+
+class ValidationError(Exception):
+    def __init__(self, errors: t.List[t.Dict[str, t.Any]]):
+        super().__init__(errors)
+        self.errors = errors
+
+
+def is_typeddict(tp: t.Any) -> bool:
+    return (
+        isinstance(tp, type)
+        and issubclass(tp, dict)
+        and hasattr(tp, "__required_keys__")
+    )
+
+
+def type_name(tp: t.Any) -> str:
+    return getattr(tp, "__name__", None) or str(tp)
+
+
+class SchemaCompiler:
+    """Generates the source of one function per type of a schema and
+    compiles them together, nested types calling each other's function.
+
+    Decoders are `decode(value, loc)`: they return the decoded value or
+    raise `ValidationError`, `loc` being the location of `value` in the
+    document. Encoders are `encode(value)` and return what the JSON codec
+    can serialize.
+    """
+
+    def __init__(self, mode: t.Literal["decode", "encode"]):
+        self.mode = mode
+        self.names: t.Dict[t.Any, str] = dict()
+        self.sources: t.List[str] = list()
+        self.namespace: t.Dict[str, t.Any] = {
+            "MISSING": MISSING,
+            "NoneType": NoneType,
+            "ValidationError": ValidationError,
+            "date": date,
+            "datetime": datetime,
+            "uuid": uuid,
+        }
+
+    def constant(self, value: t.Any) -> str:
+        name = f"_const_{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def compile(self, tp: t.Any) -> t.Callable:
+        name = self.function(tp)
+        exec("\n\n".join(self.sources), self.namespace)
+        return self.namespace[name]
+
+    def function(self, tp: t.Any) -> str:
+        name = self.names.get(tp)
+        if name is not None:
+            return name
+
+        # Named before generating the body, so that recursive types work.
+        name = self.names[tp] = f"_{self.mode}_{len(self.names)}"
+        if self.mode == "decode":
+            lines = self.decoder(tp)
+            signature = f"def {name}(value, loc):"
+        else:
+            lines = self.encoder(tp)
+            signature = f"def {name}(value):"
+
+        self.sources.append("\n".join([signature, *("    " + line for line in lines)]))
+        return name
+
+    def error(self, loc: str, msg: str) -> str:
+        return f'{{"loc": list({loc}), "msg": {msg!r}}}'
+
+    def decoder(self, tp: t.Any) -> t.List[str]:
+        origin, args = t.get_origin(tp), t.get_args(tp)
+        error = self.error("loc", f"expected {type_name(tp)}")
+        invalid = f"raise ValidationError([{error}])"
+
+        if tp is t.Any or tp is object:
+            return ["return value"]
+
+        if tp in EXACT_TYPES:
+            return [
+                f"if type(value) is {EXACT_TYPES[tp]}:",
+                "    return value",
+                invalid,
+            ]
+
+        if tp is float:
+            return [
+                "if type(value) is float or type(value) is int:",
+                "    return float(value)",
+                invalid,
+            ]
+
+        if tp in STRING_TYPES:
+            return [
+                "if type(value) is str:",
+                "    try:",
+                f"        return {STRING_TYPES[tp]}(value)",
+                "    except ValueError:",
+                "        pass",
+                invalid,
+            ]
+
+        if origin is t.Literal:
+            return [
+                f"if value in {self.constant(frozenset(args))}:",
+                "    return value",
+                invalid,
+            ]
+
+        if origin is t.Union or origin is UnionType:
+            lines = list()
+            options = [arg for arg in args if arg is not NoneType]
+            if len(options) < len(args):
+                lines += ["if value is None:", "    return None"]
+            for option in options:
+                lines += [
+                    "try:",
+                    f"    return {self.function(option)}(value, loc)",
+                    "except ValidationError:",
+                    "    pass",
+                ]
+            return lines + [invalid]
+
+        # JSON arrays are decoded as lists, so `Sequence` only accepts lists.
+        if origin in (list, t.List, t.Sequence) or tp is list:
+            return self.array_decoder(args[0] if args else t.Any, invalid)
+
+        if origin is tuple or tp is tuple:
+            if not args or (len(args) == 2 and args[1] is Ellipsis):
+                item = args[0] if args else t.Any
+                return self.array_decoder(item, invalid, "tuple(result)")
+
+            lines = [
+                f"if type(value) is not list or len(value) != {len(args)}:",
+                f"    {invalid}",
+                "result = []",
+                "errors = []",
+            ]
+            for idx, arg in enumerate(args):
+                item = self.function(arg)
+                lines += [
+                    "try:",
+                    f"    result.append({item}(value[{idx}], (*loc, {idx})))",
+                    "except ValidationError as e:",
+                    "    errors.extend(e.errors)",
+                ]
+            return lines + [
+                "if errors:",
+                "    raise ValidationError(errors)",
+                "return tuple(result)",
+            ]
+
+        if origin in (dict, t.Dict, t.Mapping) or tp is dict:
+            item = self.function(args[1] if args else t.Any)
+            return [
+                "if type(value) is not dict:",
+                f"    {invalid}",
+                "result = {}",
+                "errors = []",
+                "for key, item in value.items():",
+                "    try:",
+                f"        result[key] = {item}(item, (*loc, key))",
+                "    except ValidationError as e:",
+                "        errors.extend(e.errors)",
+                "if errors:",
+                "    raise ValidationError(errors)",
+                "return result",
+            ]
+
+        if dataclasses.is_dataclass(tp) or is_typeddict(tp):
+            return self.object_decoder(tp, invalid)
+
+        raise TypeError(f"Unsupported schema type: {tp!r}")
+
+    def array_decoder(
+        self, tp: t.Any, invalid: str, result: str = "result"
+    ) -> t.List[str]:
+        item = self.function(tp)
+        return [
+            "if type(value) is not list:",
+            f"    {invalid}",
+            "result = []",
+            "errors = []",
+            "for idx, item in enumerate(value):",
+            "    try:",
+            f"        result.append({item}(item, (*loc, idx)))",
+            "    except ValidationError as e:",
+            "        errors.extend(e.errors)",
+            "if errors:",
+            "    raise ValidationError(errors)",
+            f"return {result}",
+        ]
+
+    def object_decoder(self, tp: t.Any, invalid: str) -> t.List[str]:
+        hints = t.get_type_hints(tp)
+        lines = ["if type(value) is not dict:", f"    {invalid}", "errors = []"]
+
+        if is_typeddict(tp):
+            fields = [(key, key in tp.__required_keys__, None) for key in hints]
+            lines.append("result = {}")
+        else:
+            fields = [
+                (field.name, True, field)
+                for field in dataclasses.fields(tp)
+                if field.init
+            ]
+            lines.append("kwargs = {}")
+
+        for key, required, field in fields:
+            target = "result" if field is None else "kwargs"
+            hint = hints[key]
+            lines.append(f"item = value.get({key!r}, MISSING)")
+
+            loc = f"(*loc, {key!r})"
+            if field is not None and (
+                field.default is not dataclasses.MISSING
+                or field.default_factory is not dataclasses.MISSING
+            ):
+                required = False
+
+            # A missing optional field is left out, and the dataclass fills
+            # in its default.
+            if required:
+                error = self.error(loc, "field required")
+                lines += ["if item is MISSING:", f"    errors.append({error})"]
+            else:
+                lines += ["if item is MISSING:", "    pass"]
+
+            if hint in EXACT_TYPES:
+                error = self.error(loc, f"expected {type_name(hint)}")
+                lines += [
+                    f"elif type(item) is {EXACT_TYPES[hint]}:",
+                    f"    {target}[{key!r}] = item",
+                    "else:",
+                    f"    errors.append({error})",
+                ]
+            else:
+                lines += [
+                    "else:",
+                    "    try:",
+                    f"        {target}[{key!r}] = {self.function(hint)}(item, {loc})",
+                    "    except ValidationError as e:",
+                    "        errors.extend(e.errors)",
+                ]
+
+        lines += ["if errors:", "    raise ValidationError(errors)"]
+        if is_typeddict(tp):
+            return lines + ["return result"]
+        return lines + [f"return {self.constant(tp)}(**kwargs)"]
+
+    def encoder(self, tp: t.Any) -> t.List[str]:
+        origin, args = t.get_origin(tp), t.get_args(tp)
+        expression = self.encode_expression(tp, "value")
+        if expression is not None:
+            return [f"return {expression}"]
+
+        if origin is t.Union or origin is UnionType:
+            # Dataclasses and string types are told apart by their class, the
+            # other values are left to the JSON codec. `datetime` goes first
+            # as it is a subclass of `date`.
+            options = sorted(args, key=lambda option: option is not datetime)
+            lines = ["if value is None:", "    return None"]
+            for option in options:
+                if dataclasses.is_dataclass(option) or option in STRING_TYPES:
+                    lines += [
+                        f"if isinstance(value, {self.constant(option)}):",
+                        f"    return {self.field_expression(option, 'value')}",
+                    ]
+            return lines + ["return value"]
+
+        if dataclasses.is_dataclass(tp):
+            hints = t.get_type_hints(tp)
+            items = [
+                f"{field.name!r}: "
+                + self.field_expression(hints[field.name], f"value.{field.name}")
+                for field in dataclasses.fields(tp)
+            ]
+            return ["return {" + ", ".join(items) + "}"]
+
+        if is_typeddict(tp):
+            lines = ["result = {}"]
+            for key, hint in t.get_type_hints(tp).items():
+                lines += [
+                    f"if {key!r} in value:",
+                    f"    result[{key!r}] = "
+                    + self.field_expression(hint, f"value[{key!r}]"),
+                ]
+            return lines + ["return result"]
+
+        raise TypeError(f"Unsupported schema type: {tp!r}")
+
+    def encode_expression(self, tp: t.Any, value: str) -> str | None:
+        """An expression encoding `value` inline, if there is one."""
+        origin, args = t.get_origin(tp), t.get_args(tp)
+
+        if tp is t.Any or tp is object or tp in EXACT_TYPES or tp is float:
+            return value
+        if origin is t.Literal:
+            return value
+        if tp in (date, datetime):
+            return f"{value}.isoformat()"
+        if tp is uuid.UUID:
+            return f"str({value})"
+
+        if (origin is t.Union or origin is UnionType) and len(args) == 2:
+            option = args[0] if args[1] is NoneType else args[1]
+            if NoneType in args and option is not NoneType:
+                expression = self.encode_expression(option, value)
+                if expression == value:
+                    return value
+                if expression is not None:
+                    return f"(None if {value} is None else {expression})"
+
+        if (origin is tuple or tp is tuple) and args and args[-1] is not Ellipsis:
+            items = [
+                self.field_expression(arg, f"{value}[{idx}]")
+                for idx, arg in enumerate(args)
+            ]
+            return "[" + ", ".join(items) + "]"
+
+        if origin in (list, t.List, t.Sequence, tuple) or tp in (list, tuple):
+            item = self.field_expression(args[0] if args else t.Any, "item")
+            if item == "item":
+                return f"list({value})"
+            return f"[{item} for item in {value}]"
+
+        if origin in (dict, t.Dict, t.Mapping) or tp is dict:
+            item = self.field_expression(args[1] if args else t.Any, "item")
+            if item == "item":
+                return f"dict({value})"
+            return f"{{key: {item} for key, item in {value}.items()}}"
+
+        return None
+
+    def field_expression(self, tp: t.Any, value: str) -> str:
+        expression = self.encode_expression(tp, value)
+        if expression is not None:
+            return expression
+        return f"{self.function(tp)}({value})"
+
+
+def compile_decoder(schema: t.Any) -> t.Callable[[t.Any, Loc], t.Any]:
+    return SchemaCompiler("decode").compile(schema)
+
+
+def compile_encoder(schema: t.Any) -> t.Callable[[t.Any], t.Any]:
+    return SchemaCompiler("encode").compile(schema)
+
+
+def validation_error_response(errors: t.List[t.Dict[str, t.Any]]) -> HTTPResponse:
+    return JSONResponse(
+        {"detail": errors}, HTTPStatusCode.STATUS_422_UNPROCESSABLE_ENTITY
+    )
+
+
+def validate(
+    body: t.Any = None,
+    *,
+    response: t.Any = None,
+    status: int = HTTPStatusCode.STATUS_200_OK,
+    argument: str = "body",
+) -> t.Callable[[HTTPHandler], HTTPHandler]:
+    """Decode the JSON body of the request into `body`, a dataclass or a
+    `TypedDict`, and pass it to the handler as `argument`. An invalid body
+    is answered with a 422 listing the errors.
+
+    If the handler returns an instance of `response` instead of a response,
+    it is encoded to JSON and sent with `status`. The decoder and encoder
+    are generated once, when the handler is decorated.
+    """
+    decode = compile_decoder(body) if body is not None else None
+    encode = compile_encoder(response) if response is not None else None
+
+    def _decorator(cb: HTTPHandler) -> HTTPHandler:
+        @wraps(cb)
+        async def _inner(request: HTTPRequest, **kwargs):
+            if decode is not None:
+                try:
+                    data = await request.json()
+                except ValueError:
+                    return validation_error_response(
+                        [{"loc": [], "msg": "invalid JSON"}]
+                    )
+
+                try:
+                    kwargs[argument] = decode(data, ())
+                except ValidationError as e:
+                    return validation_error_response(e.errors)
+
+            result = await cb(request, **kwargs)
+            if encode is None or isinstance(result, HTTPResponse):
+                return result
+
+            return HTTPResponse(
+                JSONCodecs.dumps(encode(result)),
+                status,
+                content_type=APPLICATION_JSON,
+            )
+
+        return _inner
+
+    return _decorator
@@ -1,5 +1,6 @@
 from tarantino.http import HTTPRequest
-from tarantino.imports import enum, json, t
+from tarantino.imports import enum, t
+from tarantino.serialization import JSONCodecs
 from tarantino.websocket.utils import WSStatusCode
 
 
@@ -84,12 +85,11 @@ class Connection:
             err = f"Expected mode to be one of {_MSG_MODES}. Found={mode}"
             raise RuntimeError(err)
 
-        data = json.dumps(data)
+        data = JSONCodecs.dumps(data)
 
         if mode == "text":
-            await self.send(text_data=data)
+            await self.send(text_data=data.decode("utf-8"))
         else:
-            data = data.encode("utf-8")
             await self.send(bytes_data=data)
 
     async def receive(self):
@@ -138,9 +138,4 @@ class Connection:
 
         msg = await self.receive()
 
-        if mode == "text":
-            text = msg["text"]
-        else:
-            text = msg["bytes"].decode("utf-8")
-
-        return json.loads(text)
+        return JSONCodecs.loads(msg["text"] if mode == "text" else msg["bytes"])
@@ -0,0 +1,62 @@
+"""ASGI scaffolding shared by the tests, imported with `from conftest
+import ...`."""
+
+import asyncio
+import typing as t
+
+
+def http_scope(method="GET", path="/", headers=(), query_string=b"", **scope):
+    return {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": list(headers),
+        "query_string": query_string,
+        "client": ("127.0.0.1", 8000),
+        "http_version": "1.1",
+        **scope,
+    }
+
+
+def make_receive(messages: t.List[t.Dict[str, t.Any]]):
+    """`receive` returning `messages` in order and then waiting forever, as a
+    client that keeps the connection open. `receive.received` counts the
+    messages returned."""
+    messages = list(messages)
+
+    async def receive():
+        if not messages:
+            await asyncio.Event().wait()
+        receive.received += 1
+        return messages.pop(0)
+
+    receive.received = 0
+    return receive
+
+
+def receive_body(*chunks: bytes):
+    """`make_receive` with one `http.request` message per chunk, an empty
+    body without any."""
+    chunks = chunks or (b"",)
+    return make_receive(
+        [
+            {"type": "http.request", "body": chunk, "more_body": idx < len(chunks) - 1}
+            for idx, chunk in enumerate(chunks)
+        ]
+    )
+
+
+async def run_asgi(app, scope, receive=None) -> t.List[t.Dict[str, t.Any]]:
+    """Run `app` and return the messages it sent."""
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+        await asyncio.sleep(0)
+
+    await app(scope, receive or receive_body(), send)
+    return sent
+
+
+def call_asgi(app, scope, receive=None) -> t.List[t.Dict[str, t.Any]]:
+    return asyncio.run(run_asgi(app, scope, receive))
@@ -0,0 +1,170 @@
+import pytest
+
+from conftest import call_asgi, http_scope, make_receive, receive_body
+from tarantino import SubApp, Tarantino
+from tarantino.http import HTTP200Response
+from tarantino.limits import limit_body_size
+
+
+def test_url_for():
+    app = Tarantino("test")
+    blog = SubApp("/blog")
+
+    @app.get("/user/{user_id:int}/files/{filename}", name="user_file")
+    async def user_file(request, user_id, filename):
+        return HTTP200Response("")
+
+    @blog.get("/{published:bool}", name="blog_posts")
+    async def blog_posts(request, published):
+        return HTTP200Response("")
+
+    app.register_subapp(blog)
+
+    assert (
+        app.url_for("user_file", user_id=7, filename="a b/c.txt")
+        == "/user/7/files/a%20b%2Fc.txt"
+    )
+    assert app.url_for("blog_posts", published=True) == "/blog/true"
+
+    with pytest.raises(ValueError):
+        app.url_for("user_file", user_id=7)
+
+    with pytest.raises(ValueError):
+        app.url_for("missing")
+
+
+def test_lifespan_rejects_shadowed_routes():
+    app = Tarantino("test")
+
+    @app.get("/blog/{slug}")
+    async def by_slug(request, slug):
+        return HTTP200Response("")
+
+    @app.get("/blog/{title}")
+    async def by_title(request, title):
+        return HTTP200Response("")
+
+    receive = make_receive(
+        [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    )
+    sent = call_asgi(app, {"type": "lifespan"}, receive)
+    assert sent[0]["type"] == "lifespan.startup.failed"
+    assert "/blog/{title}" in sent[0]["message"]
+
+
+def test_host_routing():
+    app = Tarantino("test")
+    tenant = SubApp("", host="{tenant}.example.com")
+
+    @app.get("/")
+    async def index(request):
+        return HTTP200Response("index")
+
+    @tenant.get("/")
+    async def tenant_index(request, tenant):
+        return HTTP200Response(f"tenant {tenant}")
+
+    app.register_subapp(tenant)
+
+    _, body = call_asgi(
+        app, http_scope(path="/", headers=[(b"host", b"acme.example.com:8000")])
+    )
+    assert body["body"] == b"tenant acme"
+
+    _, body = call_asgi(app, http_scope(path="/", headers=[(b"host", b"localhost")]))
+    assert body["body"] == b"index"
+
+
+def test_not_found():
+    app = Tarantino("test")
+
+    start, body = call_asgi(app, http_scope(path="/missing"))
+    assert start["status"] == 404
+    assert body["body"] == b""
+
+    call_asgi(app, http_scope(path="/wp-login.php"))
+    assert app.not_found_count == 2
+
+
+def test_mount_static(tmp_path):
+    (tmp_path / "app.js").write_bytes(b"console.log(1)")
+    (tmp_path / "app.js.gz").write_bytes(b"gzipped")
+    (tmp_path.parent / "secret.txt").write_bytes(b"secret")
+
+    app = Tarantino("test")
+    static_files = app.mount_static("/static", tmp_path)
+
+    start, body = call_asgi(app, http_scope(path="/static/app.js"))
+    headers = dict(start["headers"])
+    assert start["status"] == 200
+    assert headers[b"content-type"].endswith(b"javascript")
+    assert b"content-encoding" not in headers
+    assert body["body"] == b"console.log(1)"
+
+    start, body = call_asgi(
+        app,
+        http_scope(
+            path="/static/app.js", headers=[(b"accept-encoding", b"br;q=0, gzip")]
+        ),
+    )
+    assert dict(start["headers"])[b"content-encoding"] == b"gzip"
+    assert body["body"] == b"gzipped"
+    assert len(static_files.cache) == 2
+
+    cached = static_files.cache[str(tmp_path / "app.js")].response
+    start, _ = call_asgi(app, http_scope(path="/static/app.js"))
+    assert static_files.cache[str(tmp_path / "app.js")].response is cached
+
+    (tmp_path / "app.js").write_bytes(b"console.log(22)")
+    start, body = call_asgi(app, http_scope(path="/static/app.js"))
+    assert body["body"] == b"console.log(22)"
+
+    start, _ = call_asgi(app, http_scope(path="/static/../secret.txt"))
+    assert start["status"] == 404
+
+    app = Tarantino("test")
+    subapp = SubApp("/docs")
+    subapp.mount_static("/assets", tmp_path)
+    app.register_subapp(subapp)
+    start, body = call_asgi(app, http_scope(path="/docs/assets/app.js"))
+    assert start["status"] == 200
+    assert body["body"] == b"console.log(22)"
+
+
+def test_max_body_size():
+    app = Tarantino("test", max_body_size=8)
+
+    @app.post("/echo")
+    async def echo(request):
+        return HTTP200Response(await request.body())
+
+    @app.post("/upload")
+    @limit_body_size(64)
+    async def upload(request):
+        return HTTP200Response(str(len(await request.body())))
+
+    calls = []
+
+    @app.post("/ignore")
+    async def ignore(request):
+        calls.append(request)
+        return HTTP200Response("ok")
+
+    def post(path, chunks, content_length=None):
+        headers = []
+        if content_length is not None:
+            headers.append((b"content-length", str(content_length).encode()))
+
+        receive = receive_body(*chunks)
+        scope = http_scope("POST", path, headers)
+        sent = call_asgi(app, scope, receive)
+        return sent[0]["status"], receive.received
+
+    assert post("/echo", [b"1234"], 4) == (200, 1)
+    assert post("/echo", [b"12", b"34"], 4) == (200, 2)
+    assert post("/echo", [b"x" * 100], 100) == (413, 0)
+    assert post("/echo", [b"12345", b"67890", b"more"]) == (413, 2)
+    assert post("/upload", [b"x" * 20], 20) == (200, 1)
+    assert post("/upload", [b"x" * 100], 100) == (413, 0)
+    assert post("/ignore", [b"x" * 100], 100) == (413, 0)
+    assert calls == []
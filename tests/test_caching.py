@@ -0,0 +1,49 @@
+import asyncio
+
+from conftest import http_scope, run_asgi
+from tarantino.caching import ResponseCache, cache_response
+from tarantino.http import HTTPRequest, JSONResponse
+
+
+def make_request(query_string=b""):
+    return HTTPRequest(http_scope(path="/items", query_string=query_string), None, None)
+
+
+def test_cache_response():
+    calls = []
+
+    @cache_response(ttl=60, vary_query=["page"])
+    async def items(request):
+        calls.append(request.query_params)
+        await asyncio.sleep(0.01)
+        return JSONResponse({"page": request.query_params.get("page")}, 200)
+
+    async def main():
+        responses = await asyncio.gather(
+            *(items(make_request(query_string=b"page=1")) for _ in range(5))
+        )
+        assert len(calls) == 1
+        assert len({id(response) for response in responses}) == 1
+
+        first = await run_asgi(responses[0], http_scope())
+        response = await items(make_request(query_string=b"page=1"))
+        again = await run_asgi(response, http_scope())
+        assert first == again
+        assert len(calls) == 1
+
+        await items(make_request(query_string=b"page=2"))
+        assert len(calls) == 2
+
+    asyncio.run(main())
+
+
+def test_response_cache_eviction():
+    cache = ResponseCache(max_size=10)
+    cache.set("a", "response a", 6, ttl=60)
+    cache.set("b", "response b", 6, ttl=60)
+    assert cache.get("a") is None
+    assert cache.get("b") == "response b"
+
+    cache.set("c", "response c", 1, ttl=-1)
+    assert cache.get("c") is None
+    assert cache.size == 6
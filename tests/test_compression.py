@@ -0,0 +1,90 @@
+import gzip
+
+import pytest
+
+from conftest import call_asgi, http_scope
+from tarantino.http import HTTPResponse, StreamingResponse
+from tarantino.middleware.compression import Compression
+
+
+def run_middleware(response, accept_encoding=b"gzip", encoding="gzip", **options):
+    middleware = Compression(**options)
+    middleware.compressors = {encoding: middleware.compressors[encoding]}
+    middleware.app = response
+    headers = [(b"accept-encoding", accept_encoding)]
+    return call_asgi(middleware, http_scope(headers=headers))
+
+
+def test_compression():
+    body = b'{"id": 1, "name": "item"}, ' * 100
+    start, message = run_middleware(
+        HTTPResponse(body, 200, content_type="application/json")
+    )
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert headers[b"vary"] == b"accept-encoding"
+    assert headers[b"content-length"] == str(len(message["body"])).encode()
+    assert gzip.decompress(message["body"]) == body
+
+    start, message = run_middleware(HTTPResponse(b"small", 200))
+    assert b"content-encoding" not in dict(start["headers"])
+    assert dict(start["headers"])[b"vary"] == b"accept-encoding"
+    assert message["body"] == b"small"
+
+    start, message = run_middleware(HTTPResponse(body, 200), b"identity")
+    assert b"content-encoding" not in dict(start["headers"])
+    assert dict(start["headers"])[b"vary"] == b"accept-encoding"
+
+    start, message = run_middleware(HTTPResponse(body, 200, content_type="image/png"))
+    assert b"content-encoding" not in dict(start["headers"])
+    assert b"vary" not in dict(start["headers"])
+
+    start, message = run_middleware(HTTPResponse(body, 200), b"gzip;q=0")
+    assert b"content-encoding" not in dict(start["headers"])
+
+
+def test_streaming_compression():
+    chunks = [b"line %d\n" % idx for idx in range(3)]
+    start, *messages = run_middleware(
+        StreamingResponse(iter(chunks)), threadpool_size=1
+    )
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    assert len(messages) == 4
+    assert all(message["body"] for message in messages[:3])
+    assert gzip.decompress(b"".join(m["body"] for m in messages)) == b"".join(chunks)
+
+
+@pytest.mark.parametrize("encoding", ["br", "zstd"])
+def test_optional_encodings(encoding):
+    if encoding == "br":
+        decompress = pytest.importorskip("brotli").decompress
+    else:
+        decompressor = pytest.importorskip("zstandard").ZstdDecompressor()
+
+        def decompress(data):
+            return decompressor.decompressobj().decompress(data)
+
+    body = b'{"id": 1, "name": "item"}, ' * 100
+    start, message = run_middleware(HTTPResponse(body, 200), b"br, zstd", encoding)
+    assert dict(start["headers"])[b"content-encoding"] == encoding.encode()
+    assert decompress(message["body"]) == body
+
+    chunks = [b"line %d\n" % idx for idx in range(3)]
+    start, *messages = run_middleware(
+        StreamingResponse(iter(chunks)), b"br, zstd", encoding
+    )
+    assert all(message["body"] for message in messages[:3])
+    assert decompress(b"".join(m["body"] for m in messages)) == b"".join(chunks)
+
+
+def test_select_encoding():
+    middleware = Compression()
+    middleware.compressors = {"gzip": middleware.compressors["gzip"]}
+
+    assert middleware.select_encoding("gzip;q=0.5") == "gzip"
+    assert middleware.select_encoding("*") == "gzip"
+    assert middleware.select_encoding("gzip;q=0, *") is None
+    assert middleware.select_encoding("*, GZIP;q=0.0") is None
+    assert middleware.select_encoding("identity") is None
@@ -0,0 +1,53 @@
+from conftest import call_asgi, http_scope, receive_body
+from tarantino.endpoint import HTTPEndpoint
+from tarantino.http import HTTP200Response
+
+
+async def get_handler(request):
+    return HTTP200Response("ok")
+
+
+def test_method_not_allowed_and_options():
+    endpoint = HTTPEndpoint("/")
+    endpoint.add_handler(get_handler, ["get"])
+
+    assert endpoint.allowed_methods == {"GET", "OPTIONS"}
+
+    start, body = call_asgi(endpoint, http_scope("POST"))
+    assert start["status"] == 405
+    assert (b"allow", b"GET, OPTIONS") in start["headers"]
+    assert body["body"] == b""
+
+    start, _ = call_asgi(endpoint, http_scope("OPTIONS"))
+    assert start["status"] == 204
+    assert (b"allow", b"GET, OPTIONS") in start["headers"]
+
+    start, body = call_asgi(endpoint, http_scope("GET"))
+    assert start["status"] == 200
+    assert body["body"] == b"ok"
+
+
+async def form_handler(request):
+    form = await request.form(max_field_size=4)
+    return HTTP200Response(form["a"])
+
+
+def test_form_errors():
+    endpoint = HTTPEndpoint("/")
+    endpoint.add_handler(form_handler, ["post"])
+    headers = [(b"content-type", b"multipart/form-data; boundary=b")]
+    part = b'--b\r\ncontent-disposition: form-data; name="a"\r\n\r\n'
+
+    def post(body):
+        receive = receive_body(body)
+        return call_asgi(endpoint, http_scope("POST", headers=headers), receive)
+
+    start, body = post(part + b"1\r\n--b--")
+    assert start["status"] == 200
+    assert body["body"] == b"1"
+
+    start, _ = post(part + b"1")
+    assert start["status"] == 400
+
+    start, _ = post(part + b"12345\r\n--b--")
+    assert start["status"] == 413
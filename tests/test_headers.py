@@ -118,3 +118,20 @@ def test_header_methods():
     ct = headers.setdefault("content-type", "text/html", decode=True)
     assert ct == "text/html"
     assert headers.get("content-type", decode=True) == "text/html"
+
+
+def test_raw_list_passthrough():
+    headers_list = [(b"host", b"localhost"), (b"accept", b"*/*")]
+    headers = Headers(headers_list=headers_list)
+
+    assert headers.get("Host", decode=True) == "localhost"
+    assert headers.to_list() is headers_list
+
+    headers.set("content-length", 0)
+    assert headers_list == [(b"host", b"localhost"), (b"accept", b"*/*")]
+    assert headers.to_list() == [
+        (b"host", b"localhost"),
+        (b"accept", b"*/*"),
+        (b"content-length", b"0"),
+    ]
+    assert headers.get("missing") is None
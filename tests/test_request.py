@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from conftest import http_scope, receive_body
+from tarantino.http import FormError, FormTooLarge, HTTPRequest
+
+
+def test_lazy_attributes():
+    scope = http_scope(
+        "POST",
+        headers=[
+            (b"cookie", b"_sessionid=abc; theme=dark"),
+            (b"content-type", b"application/json"),
+            (b"content-length", b"11"),
+        ],
+        query_string=b"page=2&tag=a&tag=b",
+    )
+    request = HTTPRequest(scope, receive_body(b'{"a": true}'), None)
+
+    assert request.query_params == {"page": ["2"], "tag": ["a", "b"]}
+    assert request.cookies == {"_sessionid": "abc", "theme": "dark"}
+    assert request.content_type == "application/json"
+    assert request.content_length == "11"
+    assert request.method == "POST"
+    assert asyncio.run(request.json()) == {"a": True}
+    assert not hasattr(request, "__dict__")
+
+
+MULTIPART_BODY = (
+    b"preamble\r\n"
+    b"--boundary\r\n"
+    b'Content-Disposition: form-data; name="title"\r\n'
+    b"\r\n"
+    b"hello\r\nworld\r\n"
+    b"--boundary\r\n"
+    b'Content-Disposition: form-data; name="upload"; filename="a.txt"\r\n'
+    b"Content-Type: text/plain\r\n"
+    b"\r\n" + b"x" * 5000 + b"\r\n"
+    b"--boundary--\r\n"
+)
+
+
+def chunked(data, size):
+    return [data[idx : idx + size] for idx in range(0, len(data), size)]
+
+
+def test_multipart_form(monkeypatch):
+    headers = [(b"content-type", b"multipart/form-data; boundary=boundary")]
+    to_thread = asyncio.to_thread
+    threaded = []
+
+    async def record_to_thread(func, *args):
+        threaded.append((func.__name__, getattr(func.__self__, "_rolled", None)))
+        return await to_thread(func, *args)
+
+    monkeypatch.setattr(asyncio, "to_thread", record_to_thread)
+
+    for size in [1, 7, 64, len(MULTIPART_BODY)]:
+        request = HTTPRequest(
+            http_scope("POST", headers=headers),
+            receive_body(*chunked(MULTIPART_BODY, size)),
+            None,
+        )
+        form = asyncio.run(request.form(spool_max_size=1024))
+        upload = form["upload"]
+
+        assert form["title"] == "hello\r\nworld"
+        assert (upload.filename, upload.content_type, upload.size) == (
+            "a.txt",
+            "text/plain",
+            5000,
+        )
+        assert upload.file._rolled
+        # The write rolling the file over to disk runs in a thread.
+        assert ("write", False) in threaded
+        assert asyncio.run(upload.read()) == b"x" * 5000
+
+    request = HTTPRequest(
+        http_scope("POST", headers=headers), receive_body(MULTIPART_BODY), None
+    )
+    with pytest.raises(FormError):
+        asyncio.run(request.form(max_file_size=1000))
+
+    # Every field is under `max_field_size`, but not all of them together.
+    field = b'--b\r\ncontent-disposition: form-data; name="a"\r\n\r\n1234\r\n'
+    headers = [(b"content-type", b"multipart/form-data; boundary=b")]
+    request = HTTPRequest(
+        http_scope("POST", headers=headers), receive_body(field * 3 + b"--b--"), None
+    )
+    with pytest.raises(FormTooLarge):
+        asyncio.run(request.form(max_field_size=4, max_fields_size=10))
+
+
+def test_urlencoded_form():
+    headers = [(b"content-type", b"application/x-www-form-urlencoded")]
+    request = HTTPRequest(
+        http_scope("POST", headers=headers), receive_body(b"a=1&b=", b"x%20y&a=2"), None
+    )
+    form = asyncio.run(request.form())
+    assert form["a"] == "1"
+    assert form.getlist("a") == ["1", "2"]
+    assert form["b"] == "x y"
+
+
+def test_body_preallocation(monkeypatch):
+    headers = [(b"content-length", b"10")]
+    request = HTTPRequest(
+        http_scope("POST", headers=headers), receive_body(b"01234", b"56789"), None
+    )
+    view = asyncio.run(request.body_view())
+    assert view.readonly
+    assert view.tobytes() == b"0123456789"
+    body = asyncio.run(request.body())
+    assert type(body) is bytes
+    assert body == b"0123456789"
+
+    request = HTTPRequest(
+        http_scope("POST", headers=headers), receive_body(b"0123"), None
+    )
+    assert asyncio.run(request.body()) == b"0123"
+
+    request = HTTPRequest(http_scope("POST"), receive_body(b"01234", b"56789"), None)
+    assert asyncio.run(request.body()) == b"0123456789"
+
+    monkeypatch.setattr(HTTPRequest, "preallocate_max_size", 4)
+    request = HTTPRequest(
+        http_scope("POST", headers=headers), receive_body(b"01234", b"56789"), None
+    )
+    assert asyncio.run(request.body()) == b"0123456789"
+
+    headers = [(b"content-length", b"1000000000")]
+    request = HTTPRequest(
+        http_scope("POST", headers=headers), receive_body(b"012"), None
+    )
+    assert asyncio.run(request.body()) == b"012"
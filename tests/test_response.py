@@ -0,0 +1,179 @@
+import asyncio
+
+import pytest
+
+from conftest import call_asgi, http_scope
+from tarantino.http import (
+    FileResponse,
+    HTTPResponse,
+    HTTPStatusCode,
+    JSONResponse,
+    StreamingResponse,
+)
+from tarantino.http.constants import (
+    APPLICATION_JSON,
+    CONTENT_LENGTH,
+    CONTENT_TYPE,
+    TEXT_PLAIN,
+    encode_content_length,
+)
+
+
+def test_streaming_response():
+    async def chunks():
+        yield "a,b\n"
+        yield b"1,2\n"
+
+    for body in [chunks(), iter(["a,b\n", b"1,2\n"])]:
+        response = StreamingResponse(body, content_type="text/csv")
+        start, *messages = call_asgi(response, http_scope())
+
+        assert start["status"] == 200
+        assert (b"content-type", b"text/csv") in start["headers"]
+        assert [message["body"] for message in messages] == [b"a,b\n", b"1,2\n", b""]
+        assert [message["more_body"] for message in messages] == [True, True, False]
+
+
+def test_streaming_response_disconnect():
+    closed = []
+
+    async def endless():
+        try:
+            while True:
+                yield b"chunk"
+                await asyncio.sleep(0)
+        finally:
+            closed.append(True)
+
+    async def receive():
+        await asyncio.sleep(0.01)
+        return {"type": "http.disconnect"}
+
+    messages = call_asgi(StreamingResponse(endless()), http_scope(), receive)
+
+    assert closed == [True]
+    assert messages[-1]["more_body"] is True
+
+
+def test_file_response(tmp_path):
+    path = tmp_path / "report.csv"
+    content = b"x" * (FileResponse.chunk_size + 10)
+    path.write_bytes(content)
+
+    start, *messages = call_asgi(FileResponse(path), http_scope())
+    headers = dict(start["headers"])
+    assert headers[b"content-type"] == b"text/csv"
+    assert headers[b"content-length"] == str(len(content)).encode()
+    assert b"last-modified" in headers
+    assert b"".join(message["body"] for message in messages) == content
+    assert [message["more_body"] for message in messages] == [True, False]
+
+    scope = http_scope(extensions={"http.response.pathsend": {}})
+    messages = call_asgi(FileResponse(path), scope)
+    assert messages[1] == {"type": "http.response.pathsend", "path": str(path)}
+
+
+def test_conditional_response():
+    response = HTTPResponse("hello world", 200, content_type="text/plain")
+    response.set_etag()
+
+    def call(*headers):
+        return call_asgi(response, http_scope(headers=headers))
+
+    start, body = call((b"if-none-match", response.etag.encode()))
+    assert start["status"] == 304
+    assert body["body"] == b""
+
+    response.enable_ranges()
+    start, body = call((b"range", b"bytes=0-4"))
+    assert start["status"] == 206
+    assert (b"content-range", b"bytes 0-4/11") in start["headers"]
+    assert body["body"] == b"hello"
+
+    start, body = call((b"range", b"bytes=20-"))
+    assert start["status"] == 416
+
+    start, body = call((b"range", b"bytes=0-4"), (b"if-range", b'"stale"'))
+    assert start["status"] == 200
+    assert body["body"] == b"hello world"
+
+    start, *parts = call((b"range", b"bytes=0-1, -2"))
+    headers = dict(start["headers"])
+    payload = b"".join(part["body"] for part in parts)
+    assert headers[b"content-type"].startswith(b"multipart/byteranges")
+    assert headers[b"content-length"] == str(len(payload)).encode()
+    assert b"\r\nhe\r\n" in payload and b"\r\nld\r\n" in payload
+
+
+def test_file_response_range(tmp_path):
+    path = tmp_path / "report.csv"
+    path.write_bytes(b"0123456789")
+
+    scope = http_scope(headers=[(b"range", b"bytes=2-5")])
+    start, *messages = call_asgi(FileResponse(path), scope)
+    headers = dict(start["headers"])
+    assert start["status"] == 206
+    assert headers[b"accept-ranges"] == b"bytes"
+    assert headers[b"content-range"] == b"bytes 2-5/10"
+    assert b"".join(message["body"] for message in messages) == b"2345"
+
+    etag = headers[b"etag"]
+    scope = http_scope("HEAD", headers=[(b"if-none-match", etag)])
+    start, body = call_asgi(FileResponse(path), scope)
+    assert start["status"] == 304
+
+
+def test_file_response_truncated(tmp_path):
+    path = tmp_path / "report.csv"
+
+    for size, headers in [(0, []), (4, [(b"range", b"bytes=6-9")])]:
+        path.write_bytes(b"0123456789")
+        response = FileResponse(path)
+        path.write_bytes(b"x" * size)
+        start, *messages = call_asgi(response, http_scope(headers=headers))
+        assert start["type"] == "http.response.start"
+        assert messages == [
+            {"type": "http.response.body", "body": b"", "more_body": False}
+        ]
+
+
+def test_status_code_validation():
+    assert HTTPStatusCode.get_status_message(404) == "NOT FOUND"
+    with pytest.raises(ValueError):
+        HTTPStatusCode.get_status_message(299)
+    with pytest.raises(AssertionError):
+        HTTPResponse("", 299)
+
+
+def test_file_response_error_status(tmp_path):
+    path = tmp_path / "404.html"
+    path.write_bytes(b"<h1>Not found</h1>")
+    etag = FileResponse(path).etag.encode()
+
+    for headers in [[(b"range", b"bytes=0-3")], [(b"if-none-match", etag)]]:
+        scope = http_scope(headers=headers)
+        start, *messages = call_asgi(FileResponse(path, status=404), scope)
+        assert start["status"] == 404
+        assert b"".join(message["body"] for message in messages) == path.read_bytes()
+
+
+def test_pre_encoded_headers():
+    # The values are the shared constants themselves, not re-encoded copies.
+    start, _ = HTTPResponse("hello", 200, content_type=TEXT_PLAIN).messages()
+    headers = dict(start["headers"])
+    assert headers[CONTENT_TYPE] is TEXT_PLAIN
+    assert headers[CONTENT_LENGTH] is encode_content_length(5)
+
+    start, _ = JSONResponse({"a": 1}, 200).messages()
+    headers = dict(start["headers"])
+    assert headers[CONTENT_TYPE] is APPLICATION_JSON
+    assert headers[CONTENT_LENGTH] is encode_content_length(len(b'{"a":1}'))
+
+    response = StreamingResponse(iter([b"a"]), content_type=TEXT_PLAIN)
+    start, *_ = call_asgi(response, http_scope())
+    headers = dict(start["headers"])
+    assert headers[CONTENT_TYPE] is TEXT_PLAIN
+    assert CONTENT_LENGTH not in headers
+
+    assert encode_content_length(4095) == b"4095"
+    assert encode_content_length(1 << 20) == b"1048576"
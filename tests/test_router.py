@@ -1,8 +1,15 @@
-from tarantino.router import Router
+import uuid
+from datetime import date
+
+import pytest
+
+from tarantino.casts import CastRegistry, StrCast
 from tarantino.endpoint import HTTPEndpoint
+from tarantino.router import Router
 
 
-def test_match_uri():
+@pytest.mark.parametrize("matcher", ["trie", "regex", "linear"])
+def test_match_uri(matcher):
     test_cases = [
         {
             "path": "/user/{user_id:int}",
@@ -22,7 +29,7 @@ def test_match_uri():
     ]
 
     for test_case in test_cases:
-        router = Router()
+        router = Router(matcher)
         path = test_case["path"]
         uri = test_case["uri"]
         kwargs = test_case["kwargs"]
@@ -35,3 +42,186 @@ def test_match_uri():
 
         for arg_name in kwargs:
             assert kwargs[arg_name] == matched_kwargs[arg_name]
+
+
+def test_match_uri_backtracking():
+    router = Router()
+    static_endpoint = HTTPEndpoint("/blog/new")
+    edit_endpoint = HTTPEndpoint("/blog/{slug}/edit")
+    int_endpoint = HTTPEndpoint("/blog/{post_id:int}")
+
+    router.add_endpoint("/blog/new", static_endpoint)
+    router.add_endpoint("/blog/{slug}/edit", edit_endpoint)
+    router.add_endpoint("/blog/{post_id:int}", int_endpoint)
+
+    assert router.match_uri("/blog/new") == (static_endpoint, {})
+    assert router.match_uri("/blog/new/edit") == (edit_endpoint, {"slug": "new"})
+    assert router.match_uri("/blog/12") == (int_endpoint, {"post_id": 12})
+    assert router.match_uri("/blog/abc") == (None, None)
+    assert router.match_uri("/blog/12/delete") == (None, None)
+
+
+def test_merge_router():
+    router = Router()
+    sub_router = Router()
+    endpoint = HTTPEndpoint("/{post_id:int}")
+    sub_router.add_endpoint("/{post_id:int}", endpoint)
+
+    router.merge_router("/user/{user_id}/post", sub_router)
+
+    matched_endpoint, matched_kwargs = router.match_uri("/user/john/post/7")
+    assert matched_endpoint == endpoint
+    assert matched_kwargs == {"user_id": "john", "post_id": 7}
+
+
+def test_frozen_static_routes():
+    router = Router()
+    static_endpoint = HTTPEndpoint("/health")
+    dynamic_endpoint = HTTPEndpoint("/user/{user_id:int}")
+
+    router.add_endpoint("/health", static_endpoint)
+    router.add_endpoint("/user/{user_id:int}", dynamic_endpoint)
+    router.freeze()
+
+    assert router.static_routes == {"/health": static_endpoint}
+    assert router.match_uri("/health") == (static_endpoint, {})
+    assert router.match_uri("/user/1") == (dynamic_endpoint, {"user_id": 1})
+
+    with pytest.raises(RuntimeError):
+        router.add_endpoint("/ready", HTTPEndpoint("/ready"))
+
+
+def test_regex_matcher_first_match():
+    router = Router("regex")
+    int_endpoint = HTTPEndpoint("/item/{item_id:int}")
+    str_endpoint = HTTPEndpoint("/item/{name}")
+
+    router.add_endpoint("/item/{item_id:int}", int_endpoint)
+    router.add_endpoint("/item/{name}", str_endpoint)
+
+    assert router.match_uri("/item/42") == (int_endpoint, {"item_id": 42})
+    assert router.match_uri("/item/foo") == (str_endpoint, {"name": "foo"})
+    assert router.match_uri("/other") == (None, None)
+
+
+def test_route_cache():
+    router = Router(cache_size=2)
+    endpoint = HTTPEndpoint("/user/{user_id:int}")
+    router.add_endpoint("/user/{user_id:int}", endpoint)
+
+    assert router.match_uri("/user/1") == (endpoint, {"user_id": 1})
+    assert router.match_uri("/user/1") == (endpoint, {"user_id": 1})
+    router.match_uri("/user/2")
+    router.match_uri("/user/3")
+    router.match_uri("/missing")
+
+    info = router.cache_info()
+    assert (info.hits, info.misses, info.evictions) == (1, 4, 1)
+    assert info.currsize == 2
+
+    sub_router = Router()
+    sub_router.add_endpoint("/{post_id:int}", HTTPEndpoint("/{post_id:int}"))
+    router.merge_router("/post", sub_router)
+    assert router.cache_info().currsize == 0
+
+
+def test_route_specificity():
+    router = Router()
+    str_endpoint = HTTPEndpoint("/blog/{slug}")
+    int_endpoint = HTTPEndpoint("/blog/{post_id:int}")
+    static_endpoint = HTTPEndpoint("/blog/latest")
+
+    router.add_endpoint("/blog/{slug}", str_endpoint)
+    router.add_endpoint("/blog/{post_id:int}", int_endpoint)
+    router.add_endpoint("/blog/latest", static_endpoint)
+    router.freeze()
+
+    assert [route.path for route in router.sorted_routes()] == [
+        "/blog/latest",
+        "/blog/{post_id:int}",
+        "/blog/{slug}",
+    ]
+    assert router.match_uri("/blog/12") == (int_endpoint, {"post_id": 12})
+    assert router.match_uri("/blog/hello") == (str_endpoint, {"slug": "hello"})
+    assert "/blog/{post_id:int}" in router.describe()
+
+
+def test_shadowed_routes():
+    router = Router()
+    router.add_endpoint("/blog/{slug}", HTTPEndpoint("/blog/{slug}"))
+    router.add_endpoint("/blog/{name:str}", HTTPEndpoint("/blog/{name:str}"))
+
+    with pytest.raises(ValueError):
+        router.freeze()
+
+
+@pytest.mark.parametrize("matcher", ["trie", "regex", "linear"])
+def test_builtin_casts(matcher):
+    router = Router(matcher)
+    static_endpoint = HTTPEndpoint("/static/{filepath:path}")
+    archive_endpoint = HTTPEndpoint("/archive/{day:date}/{slug:slug}")
+    user_endpoint = HTTPEndpoint("/user/{user_id:uuid}")
+
+    router.add_endpoint("/static/{filepath:path}", static_endpoint)
+    router.add_endpoint("/archive/{day:date}/{slug:slug}", archive_endpoint)
+    router.add_endpoint("/user/{user_id:uuid}", user_endpoint)
+
+    assert router.match_uri("/static/css/vendor/app.css") == (
+        static_endpoint,
+        {"filepath": "css/vendor/app.css"},
+    )
+    assert router.match_uri("/archive/2022-07-01/hello-world") == (
+        archive_endpoint,
+        {"day": date(2022, 7, 1), "slug": "hello-world"},
+    )
+    assert router.match_uri("/archive/2022-13-01/hello-world") == (None, None)
+    assert router.match_uri("/archive/2022-07-01/Hello") == (None, None)
+
+    user_id = "12345678-1234-5678-1234-567812345678"
+    assert router.match_uri(f"/user/{user_id}") == (
+        user_endpoint,
+        {"user_id": uuid.UUID(user_id)},
+    )
+
+    static_route = router.routes["/static/{filepath:path}"]
+    assert static_route.formatter(filepath="css/a b.css") == "/static/css/a%20b.css"
+
+
+@pytest.mark.parametrize("matcher", ["trie", "regex", "linear"])
+def test_path_cast_ordering(matcher):
+    router = Router(matcher)
+    path_endpoint = HTTPEndpoint("/f/{p:path}")
+    raw_endpoint = HTTPEndpoint("/f/{p:path}/raw")
+
+    router.add_endpoint("/f/{p:path}", path_endpoint)
+    router.add_endpoint("/f/{p:path}/raw", raw_endpoint)
+    router.freeze()
+
+    assert router.match_uri("/f/a/b/raw") == (raw_endpoint, {"p": "a/b"})
+    assert router.match_uri("/f/a/b") == (path_endpoint, {"p": "a/b"})
+
+
+@pytest.mark.parametrize("matcher", ["trie", "regex", "linear"])
+def test_cast_rejection_fallback(matcher):
+    router = Router(matcher)
+    date_endpoint = HTTPEndpoint("/a/{d:date}")
+    str_endpoint = HTTPEndpoint("/a/{s}")
+
+    router.add_endpoint("/a/{d:date}", date_endpoint)
+    router.add_endpoint("/a/{s}", str_endpoint)
+
+    assert router.match_uri("/a/2022-07-01") == (date_endpoint, {"d": date(2022, 7, 1)})
+    assert router.match_uri("/a/2022-13-01") == (str_endpoint, {"s": "2022-13-01"})
+
+
+def test_swallowed_routes(monkeypatch):
+    class AnyCast(StrCast):
+        specificity = -2
+
+    monkeypatch.setitem(CastRegistry.casts, "any", AnyCast)
+    router = Router()
+    router.add_endpoint("/f/{p:path}", HTTPEndpoint("/f/{p:path}"))
+    router.add_endpoint("/f/{name:any}", HTTPEndpoint("/f/{name:any}"))
+
+    with pytest.raises(ValueError, match="/f/{name:any}"):
+        router.freeze()
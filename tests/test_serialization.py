@@ -0,0 +1,45 @@
+import dataclasses
+import uuid
+from datetime import date, datetime
+
+import pytest
+
+from tarantino.http import JSONResponse
+from tarantino.serialization import JSONCodecs, use_json_codec
+
+
+@dataclasses.dataclass
+class Event:
+    id: uuid.UUID
+    day: date
+    tags: list
+
+
+@pytest.mark.parametrize("codec_name", list(JSONCodecs.codecs))
+def test_json_codecs(codec_name):
+    codec = JSONCodecs[codec_name]
+    event = Event(uuid.UUID(int=1), date(2024, 1, 2), ["a"])
+    data = codec.dumps({"event": event, "at": datetime(2024, 1, 2, 3, 4, 5)})
+
+    assert isinstance(data, bytes)
+    assert codec.loads(data) == {
+        "event": {
+            "id": "00000000-0000-0000-0000-000000000001",
+            "day": "2024-01-02",
+            "tags": ["a"],
+        },
+        "at": "2024-01-02T03:04:05",
+    }
+
+
+def test_use_json_codec():
+    codec_name = JSONCodecs.codec_name
+    try:
+        use_json_codec("json")
+        assert JSONCodecs.codec_name == "json"
+        assert JSONResponse({"a": [1, 2]}, 200).body == b'{"a":[1,2]}'
+    finally:
+        JSONCodecs.use(codec_name)
+
+    with pytest.raises(ValueError):
+        use_json_codec("missing")
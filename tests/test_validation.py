@@ -0,0 +1,106 @@
+import asyncio
+import dataclasses
+import typing as t
+import uuid
+from datetime import date
+
+import pytest
+
+from conftest import http_scope, receive_body
+from tarantino.http import HTTPRequest
+from tarantino.validation import (
+    ValidationError,
+    compile_decoder,
+    compile_encoder,
+    validate,
+)
+
+
+class Address(t.TypedDict, total=False):
+    city: str
+    zip: str
+
+
+@dataclasses.dataclass
+class Item:
+    id: uuid.UUID
+    name: str
+    price: float
+    tags: t.List[str] = dataclasses.field(default_factory=list)
+    released: date | None = None
+    address: Address | None = None
+
+
+@dataclasses.dataclass
+class ItemOut:
+    id: uuid.UUID
+    name: str
+    released: date | None
+
+
+def test_compile_decoder():
+    decode = compile_decoder(Item)
+    item = decode(
+        {
+            "id": "00000000-0000-0000-0000-000000000001",
+            "name": "pen",
+            "price": 2,
+            "released": "2024-01-02",
+            "address": {"city": "Pune"},
+        },
+        (),
+    )
+    assert item == Item(
+        uuid.UUID(int=1), "pen", 2.0, [], date(2024, 1, 2), {"city": "Pune"}
+    )
+
+    with pytest.raises(ValidationError) as e:
+        decode({"id": "nope", "price": "1", "tags": ["a", 1]}, ())
+    assert sorted(error["loc"] for error in e.value.errors) == [
+        ["id"],
+        ["name"],
+        ["price"],
+        ["tags", 1],
+    ]
+
+
+def call(handler, body: bytes):
+    receive = receive_body(body)
+    request = HTTPRequest(http_scope("POST"), receive, None)
+    return asyncio.run(handler(request))
+
+
+def test_validate():
+    @validate(Item, response=ItemOut, status=201)
+    async def create_item(request, body: Item):
+        return ItemOut(body.id, body.name.upper(), body.released)
+
+    response = call(
+        create_item,
+        b'{"id": "00000000-0000-0000-0000-000000000001", "name": "pen", "price": 1}',
+    )
+    assert response.status == 201
+    assert response.body == (
+        b'{"id":"00000000-0000-0000-0000-000000000001","name":"PEN","released":null}'
+    )
+
+    response = call(create_item, b'{"name": 1}')
+    assert response.status == 422
+
+    response = call(create_item, b"{")
+    assert response.status == 422
+
+
+def test_compile_tuples():
+    decode = compile_decoder(t.Tuple[int, str])
+    assert decode([1, "a"], ()) == (1, "a")
+    with pytest.raises(ValidationError) as e:
+        decode([1, 2], ())
+    assert e.value.errors[0]["loc"] == [1]
+    with pytest.raises(ValidationError):
+        decode([1, "a", 2], ())
+
+    assert compile_decoder(t.Tuple[int, ...])([1, 2, 3], ()) == (1, 2, 3)
+
+    encode = compile_encoder(t.Tuple[date, int])
+    assert encode((date(2024, 1, 2), 3)) == ["2024-01-02", 3]